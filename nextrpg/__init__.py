@@ -24,6 +24,7 @@ from nextrpg.audio.play_music_event import PlayMusicEvent
 from nextrpg.audio.sound import Sound
 from nextrpg.audio.sound_spec import SoundSpec
 from nextrpg.character.character_drawing import CharacterDrawing
+from nextrpg.character.character_index import CharacterIndex
 from nextrpg.character.character_on_screen import CharacterOnScreen
 from nextrpg.character.character_spec import CharacterSpec
 from nextrpg.character.moving_character_on_screen import MovingCharacterOnScreen
@@ -83,6 +84,7 @@ from nextrpg.config.event.say_event_config import (
 )
 from nextrpg.config.map_config import MapConfig
 from nextrpg.config.menu_config import MenuConfig
+from nextrpg.config.profiler_config import ProfilerConfig
 from nextrpg.config.rpg.item_config import BaseItemKey, ItemCategory, ItemConfig
 from nextrpg.config.rpg.rpg_config import RpgConfig
 from nextrpg.config.system.audio_config import AudioConfig
@@ -94,7 +96,8 @@ from nextrpg.config.system.key_mapping_config import (
 )
 from nextrpg.config.system.resource_config import ResourceConfig
 from nextrpg.config.system.save_config import SaveConfig
-from nextrpg.config.system.window_config import WindowConfig
+from nextrpg.config.system.window_config import WindowConfig, WindowScaling
+from nextrpg.config.trace_config import TraceConfig
 from nextrpg.config.widget.button_config import ButtonConfig
 from nextrpg.config.widget.panel_config import PanelConfig
 from nextrpg.config.widget.widget_config import WidgetConfig
@@ -115,6 +118,13 @@ from nextrpg.core.module_and_attribute import (
     ModuleAndAttribute,
     to_module_and_attribute,
 )
+from nextrpg.core.profiler import (
+    Phase,
+    PhaseStats,
+    log_profile,
+    phase_stats,
+    profile,
+)
 from nextrpg.core.save import (
     HasSaveData,
     Json,
@@ -128,6 +138,13 @@ from nextrpg.core.save import (
 )
 from nextrpg.core.time import Millisecond, Percentage
 from nextrpg.core.tmx_loader import TmxLoader, get_geometry
+from nextrpg.core.trace import (
+    is_tracing,
+    span,
+    start_trace,
+    stop_trace,
+    toggle_trace,
+)
 from nextrpg.core.util import background_thread, generator_name, type_name
 from nextrpg.drawing.color import (
     BLACK,
@@ -232,6 +249,7 @@ from nextrpg.game.game_save_meta import GameSaveMeta
 from nextrpg.game.game_state import GameState
 from nextrpg.geometry.anchor import Anchor
 from nextrpg.geometry.area_on_screen import AreaOnScreen
+from nextrpg.geometry.collision_mask import collide_mask, collision_mask
 from nextrpg.geometry.coordinate import ORIGIN, Coordinate
 from nextrpg.geometry.dimension import (
     Dimension,
@@ -255,7 +273,10 @@ from nextrpg.geometry.polygon_area_on_screen import (
     get_bounding_rectangle_area_on_screen,
 )
 from nextrpg.geometry.polyline_on_screen import PolylineOnScreen
-from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.rectangle_area_on_screen import (
+    RectangleAreaOnScreen,
+    merge_rectangle_area_on_screens,
+)
 from nextrpg.geometry.scaling import (
     HeightScaling,
     WidthAndHeightScaling,
@@ -270,6 +291,7 @@ from nextrpg.geometry.size import (
     Size,
     Width,
 )
+from nextrpg.geometry.spatial_grid import SpatialGrid
 from nextrpg.geometry.walk import Walk
 from nextrpg.gui.screen_area import (
     bottom_left_screen_area,
@@ -286,6 +308,7 @@ from nextrpg.gui.screen_area import (
 from nextrpg.gui.window import Window
 from nextrpg.item.inventory import Inventory
 from nextrpg.item.item import Item
+from nextrpg.map.chunked_layer import ChunkedLayer, TileGrid
 from nextrpg.map.map_loader import MapLoader
 from nextrpg.map.map_move import MapMove
 from nextrpg.map.map_scene import MapScene, center_player
@@ -23,6 +23,10 @@ class CharacterDrawing(Sprite, UpdateFromSave):
         direction = Direction.load_from_save(direction_str)
         return replace(self, direction=direction)
 
+    @cached_property
+    def animated_on_idle(self) -> bool:
+        return False
+
     def turn(self, direction: Direction) -> Self:
         return self
 
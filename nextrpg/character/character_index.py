@@ -0,0 +1,70 @@
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass
+from functools import cached_property
+
+from nextrpg.character.character_on_screen import CharacterOnScreen
+from nextrpg.geometry.area_on_screen import AreaOnScreen
+from nextrpg.geometry.polygon_area_on_screen import (
+    get_bounding_rectangle_area_on_screen,
+)
+from nextrpg.geometry.spatial_grid import SpatialGrid
+
+
+@dataclass(frozen=True)
+class CharacterIndex(Collection[CharacterOnScreen]):
+    characters: tuple[CharacterOnScreen, ...]
+
+    def __contains__(self, character: object) -> bool:
+        return character in self.characters
+
+    def __iter__(self) -> Iterator[CharacterOnScreen]:
+        return iter(self.characters)
+
+    def __len__(self) -> int:
+        return len(self.characters)
+
+    def collide_candidates(
+        self, area: AreaOnScreen, character: CharacterOnScreen
+    ) -> tuple[CharacterOnScreen, ...]:
+        indices = self._collision_grid.query(
+            area.rectangle_area_on_screen, touching=True
+        )
+        return self._others(indices, character)
+
+    def start_event_candidates(
+        self, character: CharacterOnScreen
+    ) -> tuple[CharacterOnScreen, ...]:
+        # Area NPCs start events on the bottom center instead of the area.
+        points = character.start_event_area_on_screen.points + (
+            character.bottom_center,
+        )
+        area = get_bounding_rectangle_area_on_screen(points)
+        indices = self._start_event_grid.query(area, touching=True)
+        return self._others(indices, character)
+
+    @cached_property
+    def _collision_grid(self) -> SpatialGrid:
+        return SpatialGrid(
+            tuple(
+                c.collision_rectangle_area_on_screen.rectangle_area_on_screen
+                for c in self.characters
+            )
+        )
+
+    @cached_property
+    def _start_event_grid(self) -> SpatialGrid:
+        return SpatialGrid(
+            tuple(
+                c.start_event_area_on_screen.rectangle_area_on_screen
+                for c in self.characters
+            )
+        )
+
+    def _others(
+        self, indices: list[int], character: CharacterOnScreen
+    ) -> tuple[CharacterOnScreen, ...]:
+        return tuple(
+            other
+            for index in indices
+            if (other := self.characters[index]) is not character
+        )
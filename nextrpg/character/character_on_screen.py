@@ -17,6 +17,7 @@ from nextrpg.core.dataclass_with_default import (
 )
 from nextrpg.core.save import UpdateFromSave
 from nextrpg.core.time import Millisecond
+from nextrpg.core.util import Percentage
 from nextrpg.drawing.color import TRANSPARENT
 from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
 from nextrpg.drawing.drawing_on_screens import (
@@ -83,11 +84,31 @@ class CharacterOnScreen(
         return self.tick_with_others(time_delta, [])
 
     def tick_with_others(
-        self, time_delta: Millisecond, others: Collection[CharacterOnScreen]
+        self,
+        time_delta: Millisecond,
+        others: Collection[CharacterOnScreen],
+        animate: bool = True,
     ) -> Self:
+        if not animate:
+            return self
         character_drawing = self.character_drawing.tick_idle(time_delta)
+        if character_drawing is self.character_drawing:
+            return self
         return replace(self, character_drawing=character_drawing)
 
+    def interpolate(
+        self, previous: CharacterOnScreen, alpha: Percentage
+    ) -> Self:
+        if previous.coordinate == self.coordinate:
+            return self
+        left, top = self.coordinate
+        previous_left, previous_top = previous.coordinate
+        coordinate = Coordinate(
+            previous_left + (left - previous_left) * alpha,
+            previous_top + (top - previous_top) * alpha,
+        )
+        return replace(self, coordinate=coordinate)
+
     @cached_property
     def drawing_on_screens(self) -> DrawingOnScreens:
         character_drawing_on_screens = (
@@ -108,6 +129,16 @@ class CharacterOnScreen(
             return self._area_on_screen
         return self._collision_rectangle_area_on_screen(self.coordinate)
 
+    @cached_property
+    def start_event_area_on_screen(self) -> AreaOnScreen:
+        if self._area_on_screen:
+            return self._area_on_screen
+
+        scaling = self.spec.config.start_event_scaling
+        top_left = self.top_left - self.width * (scaling - WidthScaling(1)) / 2
+        size = self.size * scaling
+        return top_left.as_top_left_of(size).rectangle_area_on_screen
+
     def has_same_name(self, other: CharacterOnScreen) -> bool:
         return self.spec.unique_name == other.spec.unique_name
 
@@ -147,16 +178,6 @@ class CharacterOnScreen(
             self, coordinate=coordinate, character_drawing=character_drawing
         )
 
-    @cached_property
-    def _start_event_area_on_screen(self) -> AreaOnScreen:
-        if self._area_on_screen:
-            return self._area_on_screen
-
-        scaling = self.spec.config.start_event_scaling
-        top_left = self.top_left - self.width * (scaling - WidthScaling(1)) / 2
-        size = self.size * scaling
-        return top_left.as_top_left_of(size).rectangle_area_on_screen
-
     @cached_property
     def _area_on_screen(self) -> AreaOnScreen | None:
         if not isinstance(self.character_drawing, PolygonCharacterDrawing):
@@ -191,5 +212,5 @@ class CharacterOnScreen(
     @cached_property
     def _start_event_visual(self) -> DrawingOnScreen | None:
         if (debug := config().debug) and (color := debug.start_event_rectangle):
-            return self._start_event_area_on_screen.fill(color)
+            return self.start_event_area_on_screen.fill(color)
         return None
@@ -1,14 +1,21 @@
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Iterable
 from dataclasses import dataclass, replace
+from itertools import chain
 from typing import Self, override
 
+from pygame.mask import Mask
+
+from nextrpg.character.character_drawing import CharacterDrawing
+from nextrpg.character.character_index import CharacterIndex
 from nextrpg.character.character_on_screen import CharacterOnScreen
 from nextrpg.core.logger import Logger
 from nextrpg.core.time import Millisecond
 from nextrpg.geometry.area_on_screen import AreaOnScreen
+from nextrpg.geometry.collision_mask import collide_mask
 from nextrpg.geometry.coordinate import Coordinate
 from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.spatial_grid import SpatialGrid
 
 logger = Logger("character")
 
@@ -16,34 +23,35 @@ logger = Logger("character")
 @dataclass(frozen=True, kw_only=True)
 class MovingCharacterOnScreen(CharacterOnScreen, ABC):
     map_collisions: tuple[AreaOnScreen, ...]
+    map_collision_grid: SpatialGrid | None = None
+    map_collision_mask: Mask | None = None
 
     @property
     @abstractmethod
     def moving(self) -> bool: ...
 
     @abstractmethod
-    def move(self, time_delta: Millisecond) -> Coordinate: ...
+    def move(self, time_delta: Millisecond) -> Self: ...
 
     @override
     def tick_with_others(
-        self, time_delta: Millisecond, others: Collection[CharacterOnScreen]
+        self,
+        time_delta: Millisecond,
+        others: Collection[CharacterOnScreen],
+        animate: bool = True,
     ) -> Self:
         if not self.moving or (
-            not self.can_move(moved_coordinate := self.move(time_delta), others)
+            not self.can_move(
+                (moved := self.move(time_delta)).coordinate, others
+            )
         ):
-            return super().tick_with_others(time_delta, others)
+            return super().tick_with_others(time_delta, others, animate)
 
-        character_drawing = (
-            self.character_drawing.tick(time_delta)
-            if self.moving
-            else self.character_drawing.tick_idle(time_delta)
-        )
-        ticked = replace(
-            self,
-            character_drawing=character_drawing,
-            coordinate=moved_coordinate,
-        )
-        return self._tick_after_character_and_coordinate(time_delta, ticked)
+        if animate:
+            character_drawing = self.character_drawing.tick(time_delta)
+        else:
+            character_drawing = self.character_drawing
+        return moved._tick_moved(character_drawing)
 
     def can_move(
         self, coordinate: Coordinate, others: Iterable[CharacterOnScreen]
@@ -54,27 +62,44 @@ class MovingCharacterOnScreen(CharacterOnScreen, ABC):
         collision_rectangle = self._collision_rectangle_area_on_screen(
             coordinate
         )
+        if self.map_collision_mask and collide_mask(
+            self.map_collision_mask, collision_rectangle
+        ):
+            logger.debug(t"Collided with map at {collision_rectangle.points}")
+            return False
         if collision := self._collide(collision_rectangle, others):
             logger.debug(t"Collided {collision.points}")
             return False
         return True
 
-    def _tick_after_character_and_coordinate(
-        self, time_delta: Millisecond, ticked: Self
-    ) -> Self:
-        return ticked
+    def _tick_moved(self, character_drawing: CharacterDrawing) -> Self:
+        return replace(self, character_drawing=character_drawing)
 
     def _collide(
         self,
         bounding_rect: RectangleAreaOnScreen,
         others: Iterable[CharacterOnScreen],
     ) -> AreaOnScreen | None:
+        if isinstance(others, CharacterIndex):
+            others = others.collide_candidates(bounding_rect, self)
         other_rectangle_area_on_screens = tuple(
             c.collision_rectangle_area_on_screen
             for c in others
             if c.spec.collide_with_others
         )
-        for collision in self.map_collisions + other_rectangle_area_on_screens:
+        map_collisions = self._map_collisions_near(bounding_rect)
+        for collision in chain(map_collisions, other_rectangle_area_on_screens):
             if collision.collide(bounding_rect):
                 return collision
         return None
+
+    def _map_collisions_near(
+        self, bounding_rect: RectangleAreaOnScreen
+    ) -> Iterable[AreaOnScreen]:
+        if self.map_collision_mask:
+            return ()
+        if not self.map_collision_grid:
+            return self.map_collisions
+        # Polygon collisions count touching edges, so include those too.
+        indices = self.map_collision_grid.query(bounding_rect, touching=True)
+        return (self.map_collisions[i] for i in indices)
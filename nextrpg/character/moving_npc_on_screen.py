@@ -2,6 +2,7 @@ from dataclasses import KW_ONLY, replace
 from functools import cached_property
 from typing import Any, Self, override
 
+from nextrpg.character.character_drawing import CharacterDrawing
 from nextrpg.character.moving_character_on_screen import MovingCharacterOnScreen
 from nextrpg.character.npc_on_screen import NpcOnScreen
 from nextrpg.core.dataclass_with_default import (
@@ -36,15 +37,11 @@ class MovingNpcOnScreen(NpcOnScreen, MovingCharacterOnScreen):
         return replace(character, _walk=walk)
 
     @override
-    def _tick_after_character_and_coordinate(
-        self, time_delta: Millisecond, ticked: Self
-    ) -> Self:
-        walk = self._walk.tick(time_delta)
-        return replace(
-            ticked,
-            character_drawing=ticked.character_drawing.turn(walk.direction),
-            _walk=walk,
-        )
+    def _tick_moved(self, character_drawing: CharacterDrawing) -> Self:
+        # Turning rebuilds every direction's animation, so only turn on change.
+        if character_drawing.direction != self._walk.direction:
+            character_drawing = character_drawing.turn(self._walk.direction)
+        return super()._tick_moved(character_drawing)
 
     @override
     @cached_property
@@ -52,8 +49,9 @@ class MovingNpcOnScreen(NpcOnScreen, MovingCharacterOnScreen):
         return not self._event_started and not self._walk.complete
 
     @override
-    def move(self, time_delta: Millisecond) -> Coordinate:
-        return self._walk.tick(time_delta).coordinate
+    def move(self, time_delta: Millisecond) -> Self:
+        walk = self._walk.tick(time_delta)
+        return replace(self, coordinate=walk.coordinate, _walk=walk)
 
     @property
     def _init_walk(self) -> Walk:
@@ -32,9 +32,9 @@ class NpcOnScreen(CharacterOnScreen):
         if not self.restart_event or not self.spec.event:
             return False
         if self._area_on_screen:
-            return player.bottom_center in self._start_event_area_on_screen
-        return self._start_event_area_on_screen.collide(
-            player._start_event_area_on_screen
+            return player.bottom_center in self.start_event_area_on_screen
+        return self.start_event_area_on_screen.collide(
+            player.start_event_area_on_screen
         )
 
 
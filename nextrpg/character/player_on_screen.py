@@ -72,12 +72,12 @@ class PlayerOnScreen(MovingCharacterOnScreen):
         return bool(self._movement_keys)
 
     @override
-    def move(self, time_delta: Millisecond) -> Coordinate | None:
+    def move(self, time_delta: Millisecond) -> Self:
         directional_offset = DirectionalOffset(
             self.character_drawing.direction,
             self.spec.config.move_speed * time_delta,
         )
-        return self.coordinate + directional_offset
+        return replace(self, coordinate=self.coordinate + directional_offset)
 
     @override
     def can_move(
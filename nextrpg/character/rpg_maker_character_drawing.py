@@ -86,6 +86,11 @@ class RpgMakerCharacterDrawing(CharacterDrawing):
         adjusted_direction = _adjust(self.direction)
         return self._animations[adjusted_direction].drawing
 
+    @override
+    @cached_property
+    def animated_on_idle(self) -> bool:
+        return self.animate_on_idle
+
     @override
     def turn(self, direction: Direction) -> Self:
         animation = {
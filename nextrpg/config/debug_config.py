@@ -2,6 +2,8 @@ from dataclasses import dataclass, field
 
 from nextrpg.config.drawing.text_config import TextConfig
 from nextrpg.config.logging_config import LoggingConfig
+from nextrpg.config.profiler_config import ProfilerConfig
+from nextrpg.config.trace_config import TraceConfig
 from nextrpg.drawing.color import BLUE, GREEN, RED, Color
 from nextrpg.geometry.size import Height
 
@@ -27,3 +29,5 @@ class DebugConfig:
         default_factory=_widget_metadata_text
     )
     logging: LoggingConfig | None = LoggingConfig()
+    profiler: ProfilerConfig | None = ProfilerConfig()
+    trace: TraceConfig | None = TraceConfig()
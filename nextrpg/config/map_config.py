@@ -1,5 +1,8 @@
 from dataclasses import dataclass
 
+from nextrpg.core.time import Millisecond
+from nextrpg.geometry.dimension import Pixel
+
 
 @dataclass(frozen=True)
 class MapConfig:
@@ -7,3 +10,7 @@ class MapConfig:
     foreground: str = "foreground"
     above_character: str = "above_character"
     collision: str = "collision"
+    chunk_size: Pixel = 512
+    collision_mask: bool = False
+    npc_lod_margin: Pixel | None = 256
+    npc_lod_time_step: Millisecond = 250
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from nextrpg.core.time import Millisecond
+from nextrpg.drawing.color import GREEN, Color
+from nextrpg.geometry.size import Size
+
+
+@dataclass(frozen=True)
+class ProfilerConfig:
+    sample_count: int = 240
+    frame_budget: Millisecond = 16
+    sparkline_size: Size = Size(240, 32)
+    sparkline_color: Color = GREEN
@@ -1,6 +1,13 @@
 from dataclasses import dataclass
 
+from nextrpg.core.time import Millisecond
+
 
 @dataclass(frozen=True)
 class GameLoopConfig:
     max_frames_per_second: int = 60
+    idle_frames_per_second: int | None = None
+    fixed_time_step: Millisecond | None = None
+    max_steps_per_frame: int = 5
+    max_frame_skip: int = 0
+    interpolate: bool = True
@@ -6,6 +6,7 @@ from pygame import (
     K_F1,
     K_F2,
     K_F3,
+    K_F4,
     K_LEFT,
     K_RETURN,
     K_RIGHT,
@@ -48,3 +49,4 @@ class KeyMappingConfig(metaclass=_KeyMappingMeta):
     full_screen_toggle: KeyCode | tuple[KeyCode, ...] = K_F1
     include_fps_in_title_toggle: KeyCode | tuple[KeyCode, ...] = K_F2
     debug_toggle: KeyCode | tuple[KeyCode, ...] = K_F3
+    trace_toggle: KeyCode | tuple[KeyCode, ...] = K_F4
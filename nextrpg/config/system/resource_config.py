@@ -8,4 +8,5 @@ class ResourceConfig:
     sound_cache_size: int = 8
     save_slot_cache_size: int = 8
     drawing_cache_size: int = 8192
+    map_chunk_cache_bytes: int = 128 * 1024 * 1024
     background_thread_count: int = 4
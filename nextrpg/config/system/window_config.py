@@ -1,9 +1,10 @@
 from collections.abc import Callable
 from dataclasses import dataclass, replace
+from enum import Enum, auto
 from functools import cached_property
 from typing import Any, Self, override
 
-from pygame import DOUBLEBUF, FULLSCREEN, HWSURFACE, RESIZABLE
+from pygame import DOUBLEBUF, FULLSCREEN, HWSURFACE, RESIZABLE, SCALED
 
 from nextrpg.core.save import UpdateSavable
 from nextrpg.drawing.color import BLACK, Color
@@ -11,6 +12,12 @@ from nextrpg.drawing.sprite import Sprite
 from nextrpg.geometry.size import Size
 
 
+class WindowScaling(Enum):
+    SMOOTH = auto()
+    INTEGER = auto()
+    SDL = auto()
+
+
 @dataclass(frozen=True)
 class WindowConfig(UpdateSavable[dict[str, Any]]):
     title: str = "nextrpg"
@@ -21,6 +28,8 @@ class WindowConfig(UpdateSavable[dict[str, Any]]):
     allow_resize: bool = True
     include_fps_in_window_title: bool = False
     hardware_surface: bool = True
+    scaling: WindowScaling = WindowScaling.SMOOTH
+    dirty_rectangle: bool = False
     icon_input: Sprite | Callable[[], Sprite] | None = None
 
     @cached_property
@@ -32,7 +41,12 @@ class WindowConfig(UpdateSavable[dict[str, Any]]):
         return self.icon_input
 
     def need_new_screen(self, other: WindowConfig) -> bool:
-        return self.size != other.size or self.flag != other.flag
+        if self.flag != other.flag or self.scaling != other.scaling:
+            return True
+        # SDL scales the logical screen itself, so resizing keeps the screen.
+        if self.scaling is WindowScaling.SDL:
+            return False
+        return self.size != other.size
 
     @override
     @cached_property
@@ -56,6 +70,8 @@ class WindowConfig(UpdateSavable[dict[str, Any]]):
             flag |= FULLSCREEN
         if self.allow_resize:
             flag |= RESIZABLE
+        if self.scaling is WindowScaling.SDL:
+            flag |= SCALED
         return flag
 
 
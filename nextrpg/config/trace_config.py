@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class TraceConfig:
+    file: Path = Path("nextrpg_trace.json")
+    start_enabled: bool = False
@@ -0,0 +1,98 @@
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum, auto
+from functools import cache
+from time import perf_counter
+
+from nextrpg.config.config import config
+from nextrpg.config.profiler_config import ProfilerConfig
+from nextrpg.core.logger import Logger
+from nextrpg.core.trace import span
+from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
+from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.polyline_on_screen import PolylineOnScreen
+
+logger = Logger("profiler")
+
+
+class Phase(Enum):
+    FRAME = auto()
+    EVENT = auto()
+    SCENE_TICK = auto()
+    DRAWING = auto()
+    WINDOW = auto()
+    LOG_OVERLAY = auto()
+    FLIP = auto()
+
+
+@dataclass(frozen=True)
+class PhaseStats:
+    p50: float
+    p95: float
+    p99: float
+
+
+@contextmanager
+def profile(phase: Phase) -> Iterator[None]:
+    start = perf_counter()
+    try:
+        with span(phase.name.lower(), "loop"):
+            yield
+    finally:
+        _samples(phase).append((perf_counter() - start) * 1000)
+
+
+def phase_stats(phase: Phase) -> PhaseStats | None:
+    if not (samples := sorted(_samples(phase))):
+        return None
+    return PhaseStats(
+        _percentile(samples, 0.5),
+        _percentile(samples, 0.95),
+        _percentile(samples, 0.99),
+    )
+
+
+def log_profile() -> None:
+    if not (debug := config().debug) or not (profiler := debug.profiler):
+        return
+    for phase in Phase:
+        if stats := phase_stats(phase):
+            logger.debug(
+                f"{phase.name.lower()} p50 {stats.p50:.1f} "
+                f"p95 {stats.p95:.1f} p99 {stats.p99:.1f} ms",
+                duration=None,
+            )
+    if sparkline := _sparkline(profiler):
+        logger.debug_drawing(frame=sparkline, duration=None)
+
+
+@cache
+def _samples(phase: Phase) -> deque[float]:
+    return deque(maxlen=_sample_count())
+
+
+def _sample_count() -> int:
+    if (debug := config().debug) and (profiler := debug.profiler):
+        return profiler.sample_count
+    return ProfilerConfig.sample_count
+
+
+def _percentile(samples: list[float], percentile: float) -> float:
+    index = min(int(len(samples) * percentile), len(samples) - 1)
+    return samples[index]
+
+
+def _sparkline(profiler: ProfilerConfig) -> DrawingOnScreen | None:
+    if len(frames := _samples(Phase.FRAME)) < 2:
+        return None
+    width, height = profiler.sparkline_size
+    step = width / (frames.maxlen - 1)
+    # Twice the budget spans the full height, so the middle is the budget.
+    ceiling = 2 * profiler.frame_budget
+    points = tuple(
+        Coordinate(i * step, height * (1 - min(ms, ceiling) / ceiling))
+        for i, ms in enumerate(frames)
+    )
+    return PolylineOnScreen(points).fill(profiler.sparkline_color)
@@ -19,6 +19,7 @@ from nextrpg.core.module_and_attribute import (
     ModuleAndAttribute,
     to_module_and_attribute,
 )
+from nextrpg.core.trace import span
 from nextrpg.core.util import background_thread
 
 if TYPE_CHECKING:
@@ -197,12 +198,13 @@ class SaveIo:
         from nextrpg.game.game_save_meta import GameSaveMeta
 
         key = savable.save_key()
-        blob = self._read_text()
-        blob[key] = self._serialize(key, savable.save_data)
-        json_blob = json.dumps(blob)
-        self._text_path.parent.mkdir(parents=True, exist_ok=True)
-        self._text_path.write_text(json_blob)
-        self._read_text.cache_clear()
+        with span(f"Save {key}", "save"):
+            blob = self._read_text()
+            blob[key] = self._serialize(key, savable.save_data)
+            json_blob = json.dumps(blob)
+            self._text_path.parent.mkdir(parents=True, exist_ok=True)
+            self._text_path.write_text(json_blob)
+            self._read_text.cache_clear()
         if not isinstance(savable, GameSaveMeta):
             meta = GameSaveMeta(self.slot)
             SaveIo().save(meta).result()
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from dataclasses import KW_ONLY
 from functools import cached_property
 from pathlib import Path
@@ -18,6 +19,7 @@ from nextrpg.core.dataclass_with_default import (
     private_init_below,
 )
 from nextrpg.core.metadata import METADATA_CACHE_KEY
+from nextrpg.core.trace import span
 from nextrpg.drawing.drawing import Drawing
 from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
 from nextrpg.geometry.coordinate import Coordinate
@@ -51,18 +53,23 @@ def get_coordinate(obj: TiledObject) -> Coordinate:
 class TmxLoader:
     file: str | Path
     _: KW_ONLY = private_init_below()
-    _tmx: TiledMap = default(lambda self: load_pygame(str(self.file)))
+    _tmx: TiledMap = default(lambda self: _load(self.file))
+    _objects_by_name: dict[str, TiledObject] = default(
+        lambda self: self._init_objects_by_name
+    )
+    _objects_by_class_name: dict[str, tuple[TiledObject, ...]] = default(
+        lambda self: self._init_objects_by_class_name
+    )
 
     def get_object(self, name: str) -> TiledObject:
-        for obj in self.all_objects:
-            if obj.name == name:
-                return obj
-        raise RuntimeError(f"Object {name} not found.")
+        if (obj := self._objects_by_name.get(name)) is None:
+            raise RuntimeError(f"Object {name} not found.")
+        return obj
 
     def get_objects_by_class_name(
         self, class_name: str
     ) -> tuple[TiledObject, ...]:
-        return tuple(obj for obj in self.all_objects if obj.type == class_name)
+        return self._objects_by_class_name.get(class_name, ())
 
     def image_layer(self, name: str) -> DrawingOnScreen:
         layer = self._tmx.get_layer_by_name(name)
@@ -84,6 +91,23 @@ class TmxLoader:
             for obj in self._layer(index)
         )
 
+    @property
+    def _init_objects_by_name(self) -> dict[str, TiledObject]:
+        res: dict[str, TiledObject] = {}
+        for obj in self.all_objects:
+            # The first object with a name wins, as with a linear scan.
+            res.setdefault(obj.name, obj)
+        return res
+
+    @property
+    def _init_objects_by_class_name(
+        self,
+    ) -> dict[str, tuple[TiledObject, ...]]:
+        res: defaultdict[str, list[TiledObject]] = defaultdict(list)
+        for obj in self.all_objects:
+            res[obj.type].append(obj)
+        return {class_name: tuple(objs) for class_name, objs in res.items()}
+
     def _layer(
         self, index: int
     ) -> TiledTileLayer | TiledImageLayer | TiledObjectGroup:
@@ -92,3 +116,8 @@ class TmxLoader:
 
 def is_rect(obj: TiledObject) -> bool:
     return obj.x is not None and obj.y is not None and obj.width and obj.height
+
+
+def _load(file: str | Path) -> TiledMap:
+    with span(f"Parse {Path(file).name}", "tmx"):
+        return load_pygame(str(file))
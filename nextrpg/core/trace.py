@@ -0,0 +1,97 @@
+import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from threading import Lock, current_thread, get_ident
+from time import perf_counter_ns
+from typing import Any
+
+type _TraceEvent = dict[str, Any]
+
+
+@contextmanager
+def span(name: str, category: str = "nextrpg") -> Iterator[None]:
+    if _events is None:
+        yield
+        return
+    start = perf_counter_ns()
+    try:
+        yield
+    finally:
+        _add(name, category, start, perf_counter_ns())
+
+
+def is_tracing() -> bool:
+    return _events is not None
+
+
+def start_trace() -> None:
+    global _events
+    with _lock:
+        _events = []
+        _thread_names.clear()
+
+
+def stop_trace() -> None:
+    from nextrpg.config.config import config
+    from nextrpg.config.trace_config import TraceConfig
+    from nextrpg.core.logger import Logger
+
+    global _events
+    with _lock:
+        if (events := _events) is None:
+            return
+        _events = None
+        thread_names = dict(_thread_names)
+
+    if (debug := config().debug) and debug.trace:
+        file = debug.trace.file
+    else:
+        file = TraceConfig.file
+    trace = {"traceEvents": _metadata(thread_names) + events}
+    file.write_text(json.dumps(trace))
+    Logger("trace").info(f"Trace written to {file}")
+
+
+def toggle_trace() -> None:
+    if is_tracing():
+        stop_trace()
+    else:
+        start_trace()
+
+
+def _add(name: str, category: str, start: int, end: int) -> None:
+    thread_id = get_ident()
+    event = {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": start / 1000,
+        "dur": (end - start) / 1000,
+        "pid": os.getpid(),
+        "tid": thread_id,
+    }
+    with _lock:
+        if _events is None:
+            return
+        _events.append(event)
+        if thread_id not in _thread_names:
+            _thread_names[thread_id] = current_thread().name
+
+
+def _metadata(thread_names: dict[int, str]) -> list[_TraceEvent]:
+    return [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "tid": thread_id,
+            "args": {"name": thread_name},
+        }
+        for thread_id, thread_name in thread_names.items()
+    ]
+
+
+_lock = Lock()
+_events: list[_TraceEvent] | None = None
+_thread_names: dict[int, str] = {}
@@ -14,6 +14,7 @@ from nextrpg.core.dataclass_with_default import dataclass_with_default, default
 from nextrpg.core.logger import Logger
 from nextrpg.core.metadata import METADATA_CACHE_KEY, HasMetadata, Metadata
 from nextrpg.core.save import LoadFromSave
+from nextrpg.core.trace import span
 from nextrpg.drawing.color import TRANSPARENT, WHITE, Alpha, Color
 from nextrpg.drawing.shifted_sprite import ShiftedSprite
 from nextrpg.drawing.sprite import BlurRadius, Sprite
@@ -179,9 +180,11 @@ class Drawing(Sprite, HasMetadata, LoadFromSave):
         if isinstance(self.resource, Surface):
             return self.resource
 
-        on_screen_logger.debug(f"Loading {Path(self.resource).name}")
+        name = Path(self.resource).name
+        on_screen_logger.debug(f"Loading {name}")
         console_logger.debug(f"Loading {self.resource}")
-        return image.load(self.resource).convert_alpha()
+        with span(f"Decode {name}", "drawing"):
+            return image.load(self.resource).convert_alpha()
 
     @override
     def blur(self, radius: BlurRadius) -> Self:
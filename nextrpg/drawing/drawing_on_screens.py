@@ -14,6 +14,7 @@ from nextrpg.drawing.sprite_on_screen import (
     SpriteOnScreen,
 )
 from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.dimension import Pixel
 from nextrpg.geometry.directional_offset import DirectionalOffset
 from nextrpg.geometry.size import Height, Size, Width
 
@@ -66,24 +67,31 @@ class DrawingOnScreens(SpriteOnScreen):
         if len(self.resource) == 1:
             return self.resource[0]
         surface = Surface(self.size, SRCALPHA).convert_alpha()
-        surface.blits((d - self.top_left).pygame for d in self.resource)
+        top_left = self.top_left
+        surface.fblits(
+            tuple(
+                (d.drawing.pygame, d.top_left - top_left) for d in self.resource
+            )
+        )
         drawing = Drawing(surface)
         return drawing.drawing_on_screen(self.top_left)
 
     @override
     @cached_property
     def top_left(self) -> Coordinate:
-        min_left = min(d.top_left.left for d in self.resource)
-        min_top = min(d.top_left.top for d in self.resource)
-        return min_left @ min_top
+        left, top, _, _ = self._bounds
+        return Coordinate(left, top)
 
     @cached_property
     def size(self) -> Size:
-        max_left = max(d.bottom_right.left for d in self.resource)
-        max_top = max(d.bottom_right.top for d in self.resource)
-        width = max_left - self.top_left.left
-        height = max_top - self.top_left.top
-        return width * height
+        left, top, right, bottom = self._bounds
+        return Size(right - left, bottom - top)
+
+    @cached_property
+    def _bounds(self) -> tuple[Pixel, Pixel, Pixel, Pixel]:
+        # Raw values instead of XAxis/YAxis to avoid per-drawing allocations.
+        lefts, tops, rights, bottoms = zip(*(_bound(d) for d in self.resource))
+        return min(lefts), min(tops), max(rights), max(bottoms)
 
     def __iter__(self) -> Iterable[DrawingOnScreen]:
         return iter(self.resource)
@@ -103,3 +111,10 @@ def drawing_on_screens(
             for s in sprite_on_screen:
                 res += s.drawing_on_screens.resource
     return DrawingOnScreens(tuple(res))
+
+
+def _bound(
+    drawing_on_screen: DrawingOnScreen,
+) -> tuple[Pixel, Pixel, Pixel, Pixel]:
+    surface, (left, top) = drawing_on_screen.pygame
+    return left, top, left + surface.width, top + surface.height
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any, Literal, Self, override
 from nextrpg.core.time import Millisecond
 from nextrpg.drawing.drawing_on_screens import DrawingOnScreens
 from nextrpg.game.game_state import GameState
+from nextrpg.gui.frame import Blit, blits
 from nextrpg.scene.scene import Scene
 
 if TYPE_CHECKING:
@@ -23,6 +24,11 @@ class EventScene(Scene):
             + self.drawing_on_screens_after_parent
         )
 
+    @override
+    @cached_property
+    def blits(self) -> tuple[Blit, ...]:
+        return self.parent.blits + blits(self.drawing_on_screens_after_parent)
+
     @override
     def tick(
         self, time_delta: Millisecond, state: GameState
@@ -4,6 +4,7 @@ from dataclasses import KW_ONLY, dataclass, replace
 from functools import cached_property
 from typing import Any, Callable, Generator, Self, override
 
+from nextrpg.character.character_index import CharacterIndex
 from nextrpg.character.character_on_screen import CharacterOnScreen
 from nextrpg.character.npc_on_screen import NpcOnScreen, replace_npc
 from nextrpg.character.npc_spec import EventSpecParams, NpcEventStartMode
@@ -15,7 +16,8 @@ from nextrpg.core.dataclass_with_default import (
 from nextrpg.core.logger import Logger
 from nextrpg.core.save import UpdateFromSave
 from nextrpg.core.time import Millisecond
-from nextrpg.core.util import generator_name
+from nextrpg.core.trace import span
+from nextrpg.core.util import Percentage, generator_name
 from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
 from nextrpg.drawing.drawing_on_screens import (
     DrawingOnScreens,
@@ -36,7 +38,8 @@ from nextrpg.event.event_scene import (
 )
 from nextrpg.event.io_event import is_key_press
 from nextrpg.game.game_state import GameState
-from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.coordinate import ORIGIN, Coordinate
+from nextrpg.gui.frame import Blit, blits
 from nextrpg.scene.scene import Scene
 
 on_screen_logger = Logger("event")
@@ -100,10 +103,8 @@ class EventfulScene(EventAsAttr, Scene, UpdateFromSave[dict[str, Any]]):
     def tick_without_event(
         self, time_delta: Millisecond, state: GameState
     ) -> tuple[Self, GameState]:
-        player = self.player.tick_with_others(time_delta, self.npcs)
-        npcs = tuple(
-            n.tick_with_others(time_delta, self._others(n)) for n in self.npcs
-        )
+        player = self.player.tick_with_others(time_delta, self._character_index)
+        npcs = self._tick_npcs(time_delta)
 
         if self._collided_npc:
             ended_npc = self._ended_npc
@@ -121,6 +122,22 @@ class EventfulScene(EventAsAttr, Scene, UpdateFromSave[dict[str, Any]]):
         scene = replace(ticked, _background_events=tuple(background_events))
         return scene, state
 
+    @override
+    def interpolate(self, previous: Scene, alpha: Percentage) -> Self:
+        if not isinstance(previous, EventfulScene):
+            return self
+        player = self.player.interpolate(previous.player, alpha)
+        npcs = tuple(
+            (
+                npc.interpolate(previous_npc, alpha)
+                if (previous_npc := previous.npc_dict.get(npc.spec.unique_name))
+                is not None
+                else npc
+            )
+            for npc in self.npcs
+        )
+        return replace(self, player=player, npcs=npcs)
+
     @cached_property
     def drawing_on_screens_shift(self) -> Coordinate | None:
         return None
@@ -137,6 +154,19 @@ class EventfulScene(EventAsAttr, Scene, UpdateFromSave[dict[str, Any]]):
             + background_events_drawing_on_screens
         )
 
+    @override
+    @cached_property
+    def blits(self) -> tuple[Blit, ...]:
+        # The camera shift is applied while emitting blits, so drawings keep
+        # their identity (and cached properties) while the player moves.
+        shifted = blits(
+            self.drawing_on_screens_before_shift,
+            self.drawing_on_screens_shift or ORIGIN,
+        )
+        return shifted + blits(
+            d for c in self._background_events for d in c.drawing_on_screens
+        )
+
     @property
     @abstractmethod
     def drawing_on_screens_before_shift(
@@ -210,14 +240,22 @@ class EventfulScene(EventAsAttr, Scene, UpdateFromSave[dict[str, Any]]):
         npcs = tuple(npc.update_from_save(data[npc.name]) for npc in self.npcs)
         return replace(self, player=player, npcs=npcs)
 
-    def _others(self, npc: NpcOnScreen) -> tuple[CharacterOnScreen, ...]:
-        other_npcs = tuple(n for n in self.npcs if n is not npc)
-        return (self.player,) + other_npcs
+    def _tick_npcs(self, time_delta: Millisecond) -> tuple[NpcOnScreen, ...]:
+        return tuple(
+            n.tick_with_others(time_delta, self._character_index)
+            for n in self.npcs
+        )
+
+    @cached_property
+    def _character_index(self) -> CharacterIndex:
+        return CharacterIndex((self.player,) + self.npcs)
 
     @cached_property
     def _collided_npc(self) -> NpcOnScreen | None:
-        for npc in self.npcs:
-            if npc.collide_start_event(self.player):
+        for npc in self._character_index.start_event_candidates(self.player):
+            if isinstance(npc, NpcOnScreen) and npc.collide_start_event(
+                self.player
+            ):
                 return npc
         return None
 
@@ -259,8 +297,9 @@ class EventfulScene(EventAsAttr, Scene, UpdateFromSave[dict[str, Any]]):
             return None
         ticked, state = self.tick_without_event(time_delta, state)
         try:
-            create_next_scene = ticked._event.send(self._event_result)
-            next_scene = create_next_scene(ticked)
+            with span(generator_name(ticked._event), "event"):
+                create_next_scene = ticked._event.send(self._event_result)
+                next_scene = create_next_scene(ticked)
             return next_scene, state
         except StopIteration as res:
             completed = ticked._complete_event(res.value)
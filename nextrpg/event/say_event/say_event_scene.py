@@ -28,6 +28,7 @@ from nextrpg.event.say_event.say_event_state import (
 from nextrpg.game.game_state import GameState
 from nextrpg.geometry.coordinate import Coordinate
 from nextrpg.geometry.size import Size
+from nextrpg.gui.frame import Blit
 from nextrpg.scene.scene import Scene
 
 type SayEventArg = str | Coordinate | Millisecond | Size | Sprite | AvatarPosition | SayEventConfig
@@ -44,6 +45,11 @@ class SayEventScene(EventScene):
     def drawing_on_screens(self) -> DrawingOnScreens:
         return self._state.drawing_on_screens
 
+    @override
+    @cached_property
+    def blits(self) -> tuple[Blit, ...]:
+        return self._state.blits
+
     @override
     def tick(
         self, time_delta: Millisecond, state: GameState
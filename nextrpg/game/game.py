@@ -10,6 +10,7 @@ from nextrpg.core.dataclass_with_default import (
     default,
     private_init_below,
 )
+from nextrpg.core.trace import start_trace, stop_trace
 from nextrpg.game.game_loop import GameLoop
 from nextrpg.game.game_state import GameState
 from nextrpg.scene.scene import Scene
@@ -29,16 +30,24 @@ class Game:
     def start(self) -> None:
         while self._loop.running:
             self._tick()
+        stop_trace()
 
     async def start_web(self) -> None:
         while self._loop.running:
             self._tick()
             await sleep(0)
+        stop_trace()
 
     @property
     def _init(self) -> None:
         pygame.init()
         set_config(self.config)
+        if (
+            (debug := self.config.debug)
+            and (trace := debug.trace)
+            and trace.start_enabled
+        ):
+            start_trace()
 
     def _tick(self) -> None:
         object.__setattr__(self, "_loop", self._loop.tick)
@@ -4,7 +4,8 @@ from dataclasses import KW_ONLY, field, replace
 from functools import cached_property
 from typing import Self
 
-from pygame import Clock
+import pygame
+from pygame import NOEVENT, Clock
 
 from nextrpg.audio.play_music_event import PlayMusicEvent
 from nextrpg.config.config import config, force_debug_config, set_config
@@ -16,11 +17,15 @@ from nextrpg.core.dataclass_with_default import (
     private_init_below,
 )
 from nextrpg.core.logger import Logger
+from nextrpg.core.profiler import Phase, log_profile, profile
+from nextrpg.core.time import Millisecond
+from nextrpg.core.trace import toggle_trace
 from nextrpg.core.util import type_name
 from nextrpg.event.base_event import BaseEvent
 from nextrpg.event.event_queue import EventQueue
 from nextrpg.event.io_event import Quit, is_key_press
 from nextrpg.game.game_state import GameState
+from nextrpg.gui.frame import Frame
 from nextrpg.gui.window import Window
 from nextrpg.scene.scene import Scene
 
@@ -47,39 +52,119 @@ class GameLoop:
         default_factory=lambda: config().system.game_loop
     )
     _event_queue: EventQueue = EventQueue()
+    _frame: Frame | None = None
+    _previous_scene: Scene | None = None
+    _lag: Millisecond = 0
+    _skipped_frames: int = 0
+    _idle: bool = False
 
     @cached_property
     def tick(self) -> GameLoop:
+        if (timeout := self._idle_timeout) is not None:
+            _wait_for_input(timeout)
+            time_delta = self._clock.tick()
+        else:
+            time_delta = self._clock.tick(self._config.max_frames_per_second)
+        with profile(Phase.FRAME):
+            loop = self._tick(time_delta)
+        log_profile()
+
+        global _last_scene
+        _last_scene = self._scene
+        return loop
+
+    def _tick(self, time_delta: Millisecond) -> Self:
         loop = self
         state = self.state
-        for event in loop._event_queue:
-            loop = loop._event(event, state)
+        with profile(Phase.EVENT):
+            for event in loop._event_queue:
+                loop = loop._event(event, state)
 
         fps = f"{self._clock.get_fps():.0f}"
         logger.debug(f"FPS: {type_name(self._scene)} {fps}", duration=None)
         ticked_window = loop._window.tick(fps)
-        time_delta = loop._clock.tick(loop._config.max_frames_per_second)
-        loop._window.blits(loop._scene.drawing_on_screens, time_delta)
+        # A replaced window may have a new screen to be drawn in full.
+        last_frame = self._frame if ticked_window is self._window else None
+        if loop._config.fixed_time_step:
+            loop = loop._fixed_step(time_delta, state)
+            if loop._skipped_frames:
+                frame = last_frame
+            else:
+                with profile(Phase.DRAWING):
+                    blits = loop._interpolated_scene.blits
+                with profile(Phase.WINDOW):
+                    frame = ticked_window.blits(blits, time_delta, last_frame)
+        else:
+            with profile(Phase.DRAWING):
+                blits = loop._scene.blits
+            with profile(Phase.WINDOW):
+                frame = ticked_window.blits(blits, time_delta, last_frame)
+            loop = loop._tick_scene(time_delta, state)
+        idle = loop._still(frame, last_frame)
+        return replace(loop, _window=ticked_window, _frame=frame, _idle=idle)
 
-        ticked_scene, state = loop._scene.tick(time_delta, state)
-        event_queue = loop._event_queue.tick(time_delta, state)
-        loop = replace(
-            loop,
+    def _still(self, frame: Frame | None, last_frame: Frame | None) -> bool:
+        if frame is None or self._skipped_frames or self._event_queue.events:
+            return False
+        # A scene that schedules its next change stays idle through changes.
+        return frame is last_frame or self._scene.time_until_change is not None
+
+    @property
+    def _idle_timeout(self) -> Millisecond | None:
+        if not self._idle or not (
+            idle_fps := self._config.idle_frames_per_second
+        ):
+            return None
+        timeout = 1000 / idle_fps
+        if (time_until_change := self._scene.time_until_change) is not None:
+            # Wake in time for the scene's next scheduled change.
+            timeout = min(timeout, time_until_change)
+        return max(timeout, 1000 / self._config.max_frames_per_second)
+
+    def _tick_scene(self, time_delta: Millisecond, state: GameState) -> Self:
+        with profile(Phase.SCENE_TICK):
+            scene, state = self._scene.tick(time_delta, state)
+        event_queue = self._event_queue.tick(time_delta, state)
+        return replace(
+            self,
             state=state,
-            _scene=ticked_scene,
-            _window=ticked_window,
+            _scene=scene,
             _event_queue=event_queue,
+            _previous_scene=self._scene,
         )
 
-        global _last_scene
-        _last_scene = self._scene
-        return loop
+    def _fixed_step(self, time_delta: Millisecond, state: GameState) -> Self:
+        step = self._config.fixed_time_step
+        lag = self._lag + time_delta
+        loop = self
+        for _ in range(self._config.max_steps_per_frame):
+            if lag < step:
+                return replace(loop, _lag=lag, _skipped_frames=0)
+            loop = loop._tick_scene(step, state)
+            state = loop.state
+            lag -= step
+
+        if lag >= step and self._skipped_frames < self._config.max_frame_skip:
+            # Still behind: skip rendering to spend the next frame catching up.
+            skipped_frames = self._skipped_frames + 1
+            return replace(loop, _lag=lag, _skipped_frames=skipped_frames)
+        # Drop the backlog rather than spiralling on a slow machine.
+        return replace(loop, _lag=lag % step, _skipped_frames=0)
+
+    @property
+    def _interpolated_scene(self) -> Scene:
+        if not self._config.interpolate or not self._previous_scene:
+            return self._scene
+        alpha = self._lag / self._config.fixed_time_step
+        return self._scene.interpolate(self._previous_scene, alpha)
 
     def _event(self, event: BaseEvent, state: GameState) -> Self:
         if isinstance(event, PlayMusicEvent):
             event()
         if is_key_press(event, KeyMappingConfig.debug_toggle):
             _toggle_debug()
+        if is_key_press(event, KeyMappingConfig.trace_toggle):
+            toggle_trace()
         scene, updated_state = self._scene.event(event, state)
         window = self._window.event(event)
         running = not isinstance(event, Quit)
@@ -92,6 +177,15 @@ class GameLoop:
         )
 
 
+def _wait_for_input(timeout: Millisecond) -> None:
+    # Sleep through the idle frame, but wake as soon as input arrives.
+    if (event := pygame.event.wait(max(int(timeout), 1))).type == NOEVENT:
+        return
+    # Hand the events back in order for the event queue to collect.
+    for queued in (event, *pygame.event.get()):
+        pygame.event.post(queued)
+
+
 def _toggle_debug() -> None:
     if (cfg := config()).debug:
         cfg = replace(cfg, debug=None)
@@ -0,0 +1,31 @@
+from collections.abc import Iterable
+from functools import cache
+
+from pygame.mask import Mask, from_surface
+
+from nextrpg.drawing.color import WHITE
+from nextrpg.geometry.area_on_screen import AreaOnScreen
+from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.size import Size
+
+
+def collision_mask(areas: Iterable[AreaOnScreen], size: Size) -> Mask:
+    mask = Mask(size)
+    for area in areas:
+        mask.draw(_area_mask(area), area.top_left)
+    return mask
+
+
+def collide_mask(mask: Mask, rect: RectangleAreaOnScreen) -> bool:
+    return mask.overlap(_filled_mask(rect.size), rect.top_left) is not None
+
+
+def _area_mask(area: AreaOnScreen) -> Mask:
+    if isinstance(area, RectangleAreaOnScreen):
+        return _filled_mask(area.size)
+    return from_surface(area.fill(WHITE).drawing.surface)
+
+
+@cache
+def _filled_mask(size: Size) -> Mask:
+    return Mask(size, fill=True)
@@ -1,4 +1,4 @@
-from collections.abc import Collection
+from collections.abc import Collection, Iterable
 from dataclasses import dataclass
 from functools import cached_property
 from typing import TYPE_CHECKING, override
@@ -6,12 +6,16 @@ from typing import TYPE_CHECKING, override
 from nextrpg.drawing.color import Color
 from nextrpg.geometry.area_on_screen import AreaOnScreen
 from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.dimension import Pixel
 from nextrpg.geometry.size import Height, Size, Width
 
 if TYPE_CHECKING:
     from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
     from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
 
+type _Axis = tuple[Pixel, Pixel]
+type _Range = tuple[Pixel, Pixel]
+
 
 @dataclass(frozen=True)
 class PolygonAreaOnScreen(AreaOnScreen):
@@ -46,32 +50,24 @@ class PolygonAreaOnScreen(AreaOnScreen):
         else:
             poly = PolygonAreaOnScreen(area.points)
 
-        for poly in (self, poly):
-            for i in range(len(poly.points)):
-                x1, y1 = poly.points[i]
-                x2, y2 = poly.points[(i + 1) % len(poly.points)]
-                axis = Coordinate(y1 - y2, x2 - x1)
-                proj1 = _project_polygon(axis, self)
-                proj2 = _project_polygon(axis, poly)
-                if not _overlap(proj1, proj2):
-                    return False
-        return True
+        return any(
+            not part._separates(other) and not other._separates(part)
+            for part in self._convex_parts
+            for other in poly._convex_parts
+        )
 
     @override
     def __contains__(self, other: Coordinate | AreaOnScreen) -> bool:
         if isinstance(other, AreaOnScreen):
             return all(c in self for c in other.points)
 
+        if other not in self._bounding_rectangle_area_on_screen:
+            return False
+
         inside = False
         px = other.left_value
         py = other.top_value
-        points = self.points
-        n = len(points)
-        for i in range(n):
-            x1, y1 = points[i]
-            x2, y2 = points[(i + 1) % n]
-            if y1 == y2:
-                continue
+        for (x1, y1), (x2, y2) in self._non_horizontal_edges:
             if (y1 > py) != (y2 > py):
                 x_intersect = (x2 - x1) * (py - y1) / (y2 - y1) + x1
                 if px < x_intersect:
@@ -89,6 +85,40 @@ class PolygonAreaOnScreen(AreaOnScreen):
     def _bounding_rectangle_area_on_screen(self) -> RectangleAreaOnScreen:
         return get_bounding_rectangle_area_on_screen(self.points)
 
+    @cached_property
+    def _non_horizontal_edges(
+        self,
+    ) -> tuple[tuple[Coordinate, Coordinate], ...]:
+        return tuple(
+            (start, end)
+            for start, end in _edges(self.points)
+            if start.top_value != end.top_value
+        )
+
+    @cached_property
+    def _convex_parts(self) -> tuple[PolygonAreaOnScreen, ...]:
+        # Separating axes only hold for convex polygons.
+        if _convex(self.points):
+            return (self,)
+        return tuple(PolygonAreaOnScreen(t) for t in _triangulate(self.points))
+
+    @cached_property
+    def _axes(self) -> tuple[_Axis, ...]:
+        return tuple(
+            (y1 - y2, x2 - x1) for (x1, y1), (x2, y2) in _edges(self.points)
+        )
+
+    @cached_property
+    def _projections(self) -> tuple[_Range, ...]:
+        return tuple(_project(axis, self.points) for axis in self._axes)
+
+    def _separates(self, other: PolygonAreaOnScreen) -> bool:
+        for axis, (low, high) in zip(self._axes, self._projections):
+            other_low, other_high = _project(axis, other.points)
+            if high < other_low or other_high < low:
+                return True
+        return False
+
 
 def get_bounding_rectangle_area_on_screen(
     points: Collection[Coordinate],
@@ -107,13 +137,80 @@ def get_bounding_rectangle_area_on_screen(
     return coordinate.as_top_left_of(size).rectangle_area_on_screen
 
 
-def _project_polygon(axis: Coordinate, poly: PolygonAreaOnScreen) -> Coordinate:
-    dots = tuple(x * axis[0] + y * axis[1] for x, y in poly.points)
-    return Coordinate(min(dots), max(dots))
-
-
-def _overlap(coordinate1: Coordinate, coordinate2: Coordinate) -> bool:
-    return not (
-        coordinate1.top_value < coordinate2.left_value
-        or coordinate2.top_value < coordinate1.left_value
+def _project(axis: _Axis, points: tuple[Coordinate, ...]) -> _Range:
+    axis_x, axis_y = axis
+    dots = tuple(x * axis_x + y * axis_y for x, y in points)
+    return min(dots), max(dots)
+
+
+def _edges(
+    points: tuple[Coordinate, ...],
+) -> Iterable[tuple[Coordinate, Coordinate]]:
+    return zip(points, points[1:] + points[:1])
+
+
+def _cross(a: Coordinate, b: Coordinate, c: Coordinate) -> Pixel:
+    ax, ay = a
+    bx, by = b
+    cx, cy = c
+    return (bx - ax) * (cy - by) - (by - ay) * (cx - bx)
+
+
+def _turns(points: tuple[Coordinate, ...]) -> Iterable[Pixel]:
+    for i in range(len(points)):
+        yield _cross(points[i - 1], points[i], points[(i + 1) % len(points)])
+
+
+def _convex(points: tuple[Coordinate, ...]) -> bool:
+    signs = {turn > 0 for turn in _turns(points) if turn}
+    return len(signs) <= 1
+
+
+def _orientation(points: tuple[Coordinate, ...]) -> int:
+    area = sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in _edges(points))
+    return 1 if area > 0 else -1
+
+
+def _triangulate(
+    points: tuple[Coordinate, ...],
+) -> tuple[tuple[Coordinate, ...], ...]:
+    # Ear clipping: repeatedly cut off a convex corner with no other points.
+    orientation = _orientation(points)
+    remaining = list(points)
+    triangles: list[tuple[Coordinate, ...]] = []
+    while len(remaining) > 3:
+        for i in range(len(remaining)):
+            ear = (
+                remaining[i - 1],
+                remaining[i],
+                remaining[(i + 1) % len(remaining)],
+            )
+            turn = _cross(*ear) * orientation
+            if not turn:
+                # Collinear corners add nothing to the shape.
+                del remaining[i]
+                break
+            if turn > 0 and not any(
+                _in_triangle(p, ear, orientation)
+                for p in remaining
+                if p not in ear
+            ):
+                triangles.append(ear)
+                del remaining[i]
+                break
+        else:
+            # Self-intersecting outline. Keep the rest as it is.
+            break
+    return tuple(triangles) + (tuple(remaining),)
+
+
+def _in_triangle(
+    point: Coordinate,
+    triangle: tuple[Coordinate, Coordinate, Coordinate],
+    orientation: int,
+) -> bool:
+    a, b, c = triangle
+    return all(
+        _cross(start, end, point) * orientation >= 0
+        for start, end in ((a, b), (b, c), (c, a))
     )
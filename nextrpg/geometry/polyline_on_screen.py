@@ -1,5 +1,7 @@
+from bisect import bisect_right
 from dataclasses import dataclass
 from functools import cached_property
+from itertools import accumulate
 from typing import TYPE_CHECKING
 
 from nextrpg.drawing.color import Color
@@ -20,8 +22,34 @@ class PolylineOnScreen:
 
     @cached_property
     def length(self) -> Pixel:
+        return self.arc_lengths[-1]
+
+    @cached_property
+    def arc_lengths(self) -> tuple[Pixel, ...]:
         shifted = self.points[1:] + (self.points[0],)
-        return sum(p.distance(np) for p, np in zip(self.points, shifted))
+        distances = (p.distance(np) for p, np in zip(self.points, shifted))
+        return tuple(accumulate(distances, initial=0))
+
+    def segment_index(self, distance: Pixel) -> int:
+        index = bisect_right(self.arc_lengths, distance) - 1
+        return min(index, len(self.points) - 1)
+
+    def point_at(self, distance: Pixel) -> Coordinate:
+        index = self.segment_index(distance)
+        start = self.points[index]
+        if (walked := distance - self.arc_lengths[index]) <= 0:
+            return start
+
+        end = self.points[(index + 1) % len(self.points)]
+        factor = walked / (
+            self.arc_lengths[index + 1] - self.arc_lengths[index]
+        )
+        start_left, start_top = start
+        end_left, end_top = end
+        return Coordinate(
+            start_left + (end_left - start_left) * factor,
+            start_top + (end_top - start_top) * factor,
+        )
 
     def fill(
         self,
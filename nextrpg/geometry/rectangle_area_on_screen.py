@@ -1,3 +1,5 @@
+from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, replace
 from functools import cached_property
 from typing import TYPE_CHECKING, Self, override
@@ -14,6 +16,8 @@ if TYPE_CHECKING:
     from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
     from nextrpg.drawing.rectangle_drawing import RectangleDrawing
 
+type _Bound = tuple[Pixel, Pixel, Pixel, Pixel]
+
 
 @dataclass(frozen=True)
 class RectangleAreaOnScreen(AreaOnScreen, Sizable):
@@ -88,3 +92,48 @@ class RectangleAreaOnScreen(AreaOnScreen, Sizable):
     @cached_property
     def _polygon(self) -> PolygonAreaOnScreen:
         return PolygonAreaOnScreen(self.points)
+
+
+def merge_rectangle_area_on_screens(
+    rectangle_area_on_screens: Iterable[RectangleAreaOnScreen],
+) -> tuple[RectangleAreaOnScreen, ...]:
+    bounds = {_bound(rect) for rect in rectangle_area_on_screens}
+    rows = _merge_rows(bounds)
+    merged = _transpose(_merge_rows(_transpose(rows)))
+    return tuple(
+        RectangleAreaOnScreen(
+            Coordinate(left, top), Size(right - left, bottom - top)
+        )
+        for left, top, right, bottom in sorted(merged)
+    )
+
+
+def _bound(rect: RectangleAreaOnScreen) -> _Bound:
+    left, top = rect.top_left
+    width, height = rect.size
+    return left, top, left + width, top + height
+
+
+def _merge_rows(bounds: Iterable[_Bound]) -> list[_Bound]:
+    # Rectangles spanning the same rows merge while they touch or overlap.
+    rows: defaultdict[tuple[Pixel, Pixel], list[tuple[Pixel, Pixel]]] = (
+        defaultdict(list)
+    )
+    for left, top, right, bottom in bounds:
+        rows[top, bottom].append((left, right))
+
+    res: list[_Bound] = []
+    for (top, bottom), spans in rows.items():
+        spans.sort()
+        left, right = spans[0]
+        for span_left, span_right in spans[1:]:
+            if span_left > right:
+                res.append((left, top, right, bottom))
+                left = span_left
+            right = max(right, span_right)
+        res.append((left, top, right, bottom))
+    return res
+
+
+def _transpose(bounds: Iterable[_Bound]) -> list[_Bound]:
+    return [(top, left, bottom, right) for left, top, right, bottom in bounds]
@@ -0,0 +1,82 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import cached_property
+from math import floor
+
+from nextrpg.geometry.dimension import Pixel
+from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+
+type _Cell = tuple[int, int]
+type _Bound = tuple[Pixel, Pixel, Pixel, Pixel]
+
+
+@dataclass(frozen=True)
+class SpatialGrid:
+    rectangle_area_on_screens: tuple[RectangleAreaOnScreen, ...]
+    cell_size: Pixel = 256
+
+    def query(
+        self, area: RectangleAreaOnScreen, touching: bool = False
+    ) -> list[int]:
+        bound = _bound(area)
+        candidates: set[int] = set()
+        for cell in self._cells_of(bound):
+            if indices := self._cells.get(cell):
+                candidates.update(indices)
+        overlap = _touch if touching else _overlap
+        return [
+            index
+            for index in sorted(candidates)
+            if overlap(bound, self._bounds[index])
+        ]
+
+    @cached_property
+    def _bounds(self) -> tuple[_Bound, ...]:
+        return tuple(_bound(rect) for rect in self.rectangle_area_on_screens)
+
+    @cached_property
+    def _cells(self) -> dict[_Cell, tuple[int, ...]]:
+        cells: defaultdict[_Cell, list[int]] = defaultdict(list)
+        for index, bound in enumerate(self._bounds):
+            for cell in self._cells_of(bound):
+                cells[cell].append(index)
+        return {cell: tuple(indices) for cell, indices in cells.items()}
+
+    def _cells_of(self, bound: _Bound) -> Iterable[_Cell]:
+        left, top, right, bottom = bound
+        for x in range(
+            floor(left / self.cell_size), floor(right / self.cell_size) + 1
+        ):
+            for y in range(
+                floor(top / self.cell_size), floor(bottom / self.cell_size) + 1
+            ):
+                yield x, y
+
+
+def _bound(area: RectangleAreaOnScreen) -> _Bound:
+    left, top = area.top_left
+    width, height = area.size
+    return left, top, left + width, top + height
+
+
+def _overlap(bound: _Bound, other: _Bound) -> bool:
+    left, top, right, bottom = bound
+    other_left, other_top, other_right, other_bottom = other
+    return (
+        left < other_right
+        and right > other_left
+        and top < other_bottom
+        and bottom > other_top
+    )
+
+
+def _touch(bound: _Bound, other: _Bound) -> bool:
+    left, top, right, bottom = bound
+    other_left, other_top, other_right, other_bottom = other
+    return (
+        left <= other_right
+        and right >= other_left
+        and top <= other_bottom
+        and bottom >= other_top
+    )
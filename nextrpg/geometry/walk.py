@@ -1,12 +1,8 @@
-from dataclasses import KW_ONLY, replace
+from dataclasses import KW_ONLY, dataclass, replace
 from functools import cached_property
 from typing import Any, Self, override
 
-from nextrpg.core.dataclass_with_default import (
-    dataclass_with_default,
-    default,
-    private_init_below,
-)
+from nextrpg.core.dataclass_with_default import private_init_below
 from nextrpg.core.save import UpdateFromSave
 from nextrpg.core.time import Millisecond
 from nextrpg.geometry.coordinate import Coordinate
@@ -15,14 +11,13 @@ from nextrpg.geometry.direction import Direction
 from nextrpg.geometry.polyline_on_screen import PolylineOnScreen
 
 
-@dataclass_with_default(frozen=True)
+@dataclass(frozen=True)
 class Walk(UpdateFromSave[dict[str, Any]]):
     path: PolylineOnScreen
     move_speed: PixelPerMillisecond
     cyclic: bool
     _: KW_ONLY = private_init_below()
-    coordinate: Coordinate = default(lambda self: self._initial_point)
-    _target_index: int | None = 1
+    _distance: Pixel = 0
 
     @override
     @cached_property
@@ -34,9 +29,18 @@ class Walk(UpdateFromSave[dict[str, Any]]):
 
     @override
     def update_this_class_from_save(self, data: dict[str, Any]) -> Self:
+        if (target_index := data["target_index"]) is None:
+            return replace(self, _distance=self._end)
+
         coordinate = Coordinate.load_from_save(data["coordinate"])
-        target_index = data["target_index"]
-        return replace(self, coordinate=coordinate, _target_index=target_index)
+        index = (target_index - 1) % len(self.path.points)
+        start = self.path.points[index]
+        distance = self.path.arc_lengths[index] + start.distance(coordinate)
+        return replace(self, _distance=distance)
+
+    @cached_property
+    def coordinate(self) -> Coordinate:
+        return self.path.point_at(self._distance)
 
     @cached_property
     def direction(self) -> Direction:
@@ -50,62 +54,36 @@ class Walk(UpdateFromSave[dict[str, Any]]):
 
     @cached_property
     def reset(self) -> Self:
-        return replace(self, coordinate=self._initial_point, _target_index=1)
+        return replace(self, _distance=0)
 
     def tick(self, time_delta: Millisecond) -> Self:
         if self.complete:
             return self
 
-        total_dist = self.move_speed * time_delta
-        if not self.cyclic and total_dist >= self._remaining_dist:
-            return replace(
-                self, coordinate=self._final_target, _target_index=None
-            )
-
-        remaining_dist = total_dist % self.path.length
-        coordinate = self.coordinate
-        index = self._target_index
-
-        while remaining_dist:
-            target = self.path.points[index]
-            dist_to_target = coordinate.distance(target)
-            if remaining_dist < dist_to_target:
-                factor = remaining_dist / dist_to_target
-                left = (
-                    coordinate.left + (target.left - coordinate.left) * factor
-                )
-                top = coordinate.top + (target.top - coordinate.top) * factor
-                coordinate = left @ top
-                break
-
-            remaining_dist -= dist_to_target
-            coordinate = target
-            index = self._next_index(index)
-
-        return replace(self, coordinate=coordinate, _target_index=index)
+        distance = self._distance + self.move_speed * time_delta
+        if self.cyclic:
+            distance %= self.path.length
+        else:
+            distance = min(distance, self._end)
+        return replace(self, _distance=distance)
 
     @cached_property
     def complete(self) -> bool:
-        return self._target_index is None
-
-    def _next_index(self, index: int) -> int:
-        stepped = index + 1
-        if stepped == len(self.path.points):
-            return 0
-        return stepped
+        return not self.cyclic and self._distance >= self._end
 
     @cached_property
-    def _remaining_dist(self) -> Pixel:
-        points = self.path.points
-        reaming_poly = replace(self.path, points=points[self._target_index :])
-        return (
-            points[self._target_index].distance(self.coordinate)
-            + reaming_poly.length
-        )
+    def _target_index(self) -> int | None:
+        if self.complete:
+            return None
+        index = self.path.segment_index(self._distance) + 1
+        if index == len(self.path.points):
+            return 0
+        return index
 
     @cached_property
-    def _initial_point(self) -> Coordinate:
-        return self.path.points[0]
+    def _end(self) -> Pixel:
+        # The path's length includes the segment back to its first point.
+        return self.path.arc_lengths[len(self.path.points) - 1]
 
     @cached_property
     def _final_target(self) -> Coordinate:
@@ -0,0 +1,58 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import zip_longest
+
+from pygame import Rect, Surface
+
+from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
+from nextrpg.geometry.coordinate import ORIGIN, Coordinate
+
+type Blit = tuple[Surface, Coordinate]
+
+
+@dataclass(frozen=True)
+class Frame:
+    blits: tuple[Blit, ...]
+
+    def dirty_rectangles(self, last: Frame) -> list[Rect]:
+        # Blits are compared slot by slot, so a pixel outside every changed
+        # slot is covered by the same blits in the same order in both frames.
+        # Surfaces are compared by identity, as drawings copy a surface rather
+        # than modify it.
+        rects = [
+            Rect(coordinate, surface.size)
+            for blit, last_blit in zip_longest(
+                self.blits, last.blits, fillvalue=_NO_BLIT
+            )
+            if blit != last_blit
+            for surface, coordinate in (blit, last_blit)
+            if surface is not None
+        ]
+        if len(rects) > _MAX_DIRTY_RECTANGLES:
+            return [rects[0].unionall(rects[1:])]
+        return _merge(rects)
+
+
+def blits(
+    drawing_on_screens: Iterable[DrawingOnScreen], camera: Coordinate = ORIGIN
+) -> tuple[Blit, ...]:
+    if camera == ORIGIN:
+        return tuple(d.pygame for d in drawing_on_screens)
+    camera_left, camera_top = camera
+    return tuple(
+        (surface, Coordinate(left + camera_left, top + camera_top))
+        for surface, (left, top) in (d.pygame for d in drawing_on_screens)
+    )
+
+
+_MAX_DIRTY_RECTANGLES = 16
+_NO_BLIT = (None, None)
+
+
+def _merge(rects: list[Rect]) -> list[Rect]:
+    merged: list[Rect] = []
+    for rect in rects:
+        while (index := rect.collidelist(merged)) != -1:
+            rect = rect.union(merged.pop(index))
+        merged.append(rect)
+    return merged
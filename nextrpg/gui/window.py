@@ -1,16 +1,17 @@
 import os
 from collections.abc import Collection, Iterable
-from dataclasses import KW_ONLY, field, replace
+from dataclasses import KW_ONLY, dataclass, field, replace
 from functools import cached_property
 from itertools import chain
 from typing import Self
 
-from pygame import SRCALPHA, Surface
-from pygame.display import flip, set_caption, set_icon, set_mode
+from pygame import SRCALPHA, Rect, Surface
+from pygame.display import flip, set_caption, set_icon, set_mode, update
+from pygame.transform import scale, smoothscale
 
 from nextrpg.config.config import config, set_config
 from nextrpg.config.system.key_mapping_config import KeyMappingConfig
-from nextrpg.config.system.window_config import WindowConfig
+from nextrpg.config.system.window_config import WindowConfig, WindowScaling
 from nextrpg.core.dataclass_with_default import (
     dataclass_with_default,
     default,
@@ -22,14 +23,12 @@ from nextrpg.core.logger import (
     MessageKeyAndDrawing,
     pop_messages,
 )
+from nextrpg.core.profiler import Phase, profile
 from nextrpg.core.save import SaveIo
 from nextrpg.core.time import Millisecond
-from nextrpg.drawing.drawing import Drawing
+from nextrpg.drawing.color import TRANSPARENT
 from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
-from nextrpg.drawing.drawing_on_screens import (
-    DrawingOnScreens,
-    drawing_on_screens,
-)
+from nextrpg.drawing.drawing_on_screens import drawing_on_screens
 from nextrpg.drawing.sprite_on_screen import SpriteOnScreen
 from nextrpg.drawing.text import Text
 from nextrpg.event.base_event import BaseEvent
@@ -39,10 +38,10 @@ from nextrpg.event.io_event import (
     is_key_press,
 )
 from nextrpg.geometry.anchor import Anchor
-from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.coordinate import ORIGIN, Coordinate
 from nextrpg.geometry.dimension import ValueScaling
-from nextrpg.geometry.scaling import WidthAndHeightScaling
 from nextrpg.geometry.size import ZERO_HEIGHT, Size
+from nextrpg.gui.frame import Blit, Frame
 
 logger = Logger("window")
 
@@ -60,6 +59,9 @@ class Window:
     _screen: Surface = default(
         lambda self: self._set_screen(self.current_config)
     )
+    _buffers: _FrameBuffers | None = default(
+        lambda self: _frame_buffers(self.initial_config, self.current_config)
+    )
 
     def __post_init__(self) -> None:
         os.environ.setdefault("SDL_VIDEO_CENTERED", "1")
@@ -89,11 +91,13 @@ class Window:
             )
 
         screen = self._set_screen(updated_config)
+        buffers = _frame_buffers(self.initial_config, updated_config)
         return replace(
             self,
             current_config=updated_config,
             last_config=self.current_config,
             _screen=screen,
+            _buffers=buffers,
         )
 
     def event(self, event: BaseEvent) -> Self:
@@ -108,22 +112,41 @@ class Window:
         return self
 
     def blits(
-        self, drawing_on_screens: DrawingOnScreens, time_delta: Millisecond
-    ) -> None:
+        self,
+        blits: tuple[Blit, ...],
+        time_delta: Millisecond,
+        last_frame: Frame | None = None,
+    ) -> Frame | None:
         logger.debug(
             f"Size {self.current_config.size} Shift {self._center_shift}",
             duration=None,
         )
-        self._screen.fill(self.current_config.background.pygame)
+        msgs = pop_messages(time_delta)
+        frame = Frame(blits)
+        if last_frame and not msgs and frame.blits == last_frame.blits:
+            # Nothing changed, so keep what is already on screen.
+            return last_frame
+        if self._dirty_rectangle and last_frame and not msgs:
+            self._draw_dirty_rectangles(frame, last_frame)
+            return frame
 
-        base = Surface(self.initial_config.size, SRCALPHA).convert_alpha()
-        base.blits(d.pygame for d in drawing_on_screens)
-        scaled = Drawing(base) * WidthAndHeightScaling(self._scaling)
-        self._screen.blit(scaled.pygame, self._center_shift)
-        if msgs := pop_messages(time_delta):
-            logs = _log(msgs)
-            self._screen.blits(d.pygame for d in logs)
-        flip()
+        self._screen.fill(self.current_config.background.pygame)
+        if self._buffers:
+            scaled = self._buffers.draw(frame)
+            self._screen.blit(scaled, self._center_shift)
+        elif self._game_area is not None:
+            self._game_area.fblits(frame.blits)
+        else:
+            self._draw_cropped(frame)
+        if msgs:
+            with profile(Phase.LOG_OVERLAY):
+                logs = _log(msgs)
+                self._screen.fblits(tuple(d.pygame for d in logs))
+            # Log overlay isn't tracked, so the next frame is redrawn in full.
+            frame = None
+        with profile(Phase.FLIP):
+            flip()
+        return frame
 
     def toggle_full_screen(self) -> Self:
         full_screen = not self.current_config.full_screen
@@ -146,19 +169,62 @@ class Window:
         _set_window_config(window_config)
         return self.tick()
 
+    def _draw_dirty_rectangles(self, frame: Frame, last_frame: Frame) -> None:
+        if not (rects := frame.dirty_rectangles(last_frame)):
+            return
+        background = self.current_config.background.pygame
+        for rect in rects:
+            self._screen.set_clip(rect)
+            self._screen.fill(background)
+            self._screen.fblits(frame.blits)
+        self._screen.set_clip(None)
+        update(rects)
+
+    @cached_property
+    def _dirty_rectangle(self) -> bool:
+        return (
+            self.current_config.dirty_rectangle
+            and not self._buffers
+            and self._center_shift == ORIGIN
+        )
+
+    def _draw_cropped(self, frame: Frame) -> None:
+        # The game is larger than the window, so shift each blit and let the
+        # clip crop whatever falls outside the screen.
+        left, top = self._center_shift
+        shifted = tuple(
+            (surface, (x + left, y + top)) for surface, (x, y) in frame.blits
+        )
+        self._screen.set_clip(self._game_rect)
+        self._screen.fblits(shifted)
+        self._screen.set_clip(None)
+
+    @cached_property
+    def _game_area(self) -> Surface | None:
+        if self._center_shift == ORIGIN:
+            return self._screen
+        if not self._screen.get_rect().contains(self._game_rect):
+            return None
+        # Letterbox: a subsurface offsets and clips drawings in one go.
+        return self._screen.subsurface(self._game_rect)
+
+    @cached_property
+    def _game_rect(self) -> Rect:
+        return Rect(self._center_shift, self.initial_config.size)
+
     def _set_screen(self, cfg: WindowConfig) -> Surface:
+        if cfg.scaling is WindowScaling.SDL:
+            return set_mode(self.initial_config.size, cfg.flag)
         return set_mode(cfg.size, cfg.flag)
 
     @cached_property
     def _scaling(self) -> ValueScaling:
-        current_width, current_height = self.current_config.size
-        initial_width, initial_height = self.initial_config.size
-        width_ratio = current_width / initial_width
-        height_ratio = current_height / initial_height
-        return min(width_ratio, height_ratio)
+        return _scaling(self.initial_config, self.current_config)
 
     @cached_property
     def _center_shift(self) -> Coordinate:
+        if self.current_config.scaling is WindowScaling.SDL:
+            return ORIGIN
         current_width, current_height = self.current_config.size
         initial_width, initial_height = self.initial_config.size
         width_shift = (current_width - self._scaling * initial_width) / 2
@@ -175,6 +241,48 @@ class Window:
         return saved_config
 
 
+@dataclass(frozen=True)
+class _FrameBuffers:
+    frame: Surface
+    scaled: Surface
+    smooth: bool
+
+    def draw(self, frame: Frame) -> Surface:
+        self.frame.fill(TRANSPARENT.pygame)
+        self.frame.fblits(frame.blits)
+        if self.smooth:
+            smoothscale(self.frame, self.scaled.size, self.scaled)
+        else:
+            scale(self.frame, self.scaled.size, self.scaled)
+        return self.scaled
+
+
+def _frame_buffers(
+    initial: WindowConfig, current: WindowConfig
+) -> _FrameBuffers | None:
+    if (scaling := _scaling(initial, current)) == 1:
+        return None
+    width, height = initial.size
+    frame = Surface((width, height), SRCALPHA).convert_alpha()
+    scaled_size = (int(width * scaling), int(height * scaling))
+    scaled = Surface(scaled_size, SRCALPHA).convert_alpha()
+    smooth = current.scaling is WindowScaling.SMOOTH
+    return _FrameBuffers(frame, scaled, smooth)
+
+
+def _scaling(initial: WindowConfig, current: WindowConfig) -> ValueScaling:
+    if current.scaling is WindowScaling.SDL:
+        return 1
+    current_width, current_height = current.size
+    initial_width, initial_height = initial.size
+    width_ratio = current_width / initial_width
+    height_ratio = current_height / initial_height
+    ratio = min(width_ratio, height_ratio)
+    if current.scaling is WindowScaling.INTEGER:
+        return max(int(ratio), 1)
+    return ratio
+
+
 def _set_window_config(window_config: WindowConfig) -> None:
     SaveIo().save(window_config)
     current_config = config()
@@ -0,0 +1,167 @@
+from array import array
+from dataclasses import dataclass
+from functools import cache, cached_property
+from math import ceil, floor
+from typing import override
+
+from cachetools import LRUCache
+from pygame import SRCALPHA, Surface
+
+from nextrpg.config.config import config
+from nextrpg.core.metadata import Metadata
+from nextrpg.drawing.drawing import Drawing
+from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
+from nextrpg.drawing.drawing_on_screens import DrawingOnScreens
+from nextrpg.drawing.sprite_on_screen import SpriteOnScreen
+from nextrpg.geometry.coordinate import ORIGIN, Coordinate
+from nextrpg.geometry.dimension import Pixel
+from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.size import Size
+
+type _Chunk = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class TileGrid:
+    width: int
+    tile_size: Size
+    gids: array[int]
+    drawings: dict[int, Drawing]
+
+    def tiles(
+        self, left: Pixel, top: Pixel, right: Pixel, bottom: Pixel
+    ) -> list[DrawingOnScreen]:
+        tile_width, tile_height = self.tile_size
+        overflow_width, overflow_height = self._overflow
+        columns = range(
+            max(floor((left - overflow_width) / tile_width), 0),
+            min(ceil(right / tile_width), self.width),
+        )
+        rows = range(
+            max(floor((top - overflow_height) / tile_height), 0),
+            min(ceil(bottom / tile_height), self._height),
+        )
+        res: list[DrawingOnScreen] = []
+        for row in rows:
+            for column in columns:
+                gid = self.gids[row * self.width + column]
+                if (drawing := self.drawings.get(gid)) is not None:
+                    coordinate = Coordinate(
+                        column * tile_width, row * tile_height
+                    )
+                    res.append(drawing.drawing_on_screen(coordinate))
+        return res
+
+    @cached_property
+    def size(self) -> Size:
+        tile_width, tile_height = self.tile_size
+        overflow_width, overflow_height = self._overflow
+        width = self.width * tile_width + overflow_width
+        height = self._height * tile_height + overflow_height
+        return Size(width, height)
+
+    @cached_property
+    def _height(self) -> int:
+        return len(self.gids) // self.width
+
+    @cached_property
+    def _overflow(self) -> tuple[Pixel, Pixel]:
+        # Tile images may be larger than a grid cell and spill into neighbors.
+        tile_width, tile_height = self.tile_size
+        sizes = tuple(drawing.size for drawing in self.drawings.values())
+        width = max((width for width, _ in sizes), default=tile_width)
+        height = max((height for _, height in sizes), default=tile_height)
+        return max(width - tile_width, 0), max(height - tile_height, 0)
+
+
+@dataclass(frozen=True)
+class ChunkedLayer(SpriteOnScreen):
+    grids: tuple[TileGrid, ...]
+    metadata: Metadata
+    chunk_size: Pixel = 512
+
+    @property
+    def drawing_on_screens(self) -> DrawingOnScreens:
+        width, height = self.size
+        return self._visible_chunks(0, 0, width, height)
+
+    def visible(self, viewport: RectangleAreaOnScreen) -> DrawingOnScreens:
+        left, top = viewport.top_left
+        width, height = viewport.size
+        return self._visible_chunks(left, top, left + width, top + height)
+
+    @override
+    @cached_property
+    def top_left(self) -> Coordinate:
+        return ORIGIN
+
+    @override
+    @cached_property
+    def size(self) -> Size:
+        widths, heights = zip(*(grid.size for grid in self.grids))
+        return Size(max(widths), max(heights))
+
+    @cached_property
+    def _empty_chunks(self) -> set[_Chunk]:
+        return set()
+
+    def _visible_chunks(
+        self, left: Pixel, top: Pixel, right: Pixel, bottom: Pixel
+    ) -> DrawingOnScreens:
+        width, height = self.size
+        chunks = tuple(
+            drawing_on_screen
+            for x in self._range(max(left, 0), min(right, width))
+            for y in self._range(max(top, 0), min(bottom, height))
+            if (drawing_on_screen := self._chunk((x, y))) is not None
+        )
+        return DrawingOnScreens(chunks)
+
+    def _range(self, start: Pixel, end: Pixel) -> range:
+        return range(
+            floor(start / self.chunk_size), ceil(end / self.chunk_size)
+        )
+
+    def _chunk(self, chunk: _Chunk) -> DrawingOnScreen | None:
+        key = (self.metadata, self.chunk_size, chunk)
+        if (drawing_on_screen := _chunks().get(key)) is not None:
+            return drawing_on_screen
+        if chunk in self._empty_chunks:
+            return None
+
+        x, y = chunk
+        left = x * self.chunk_size
+        top = y * self.chunk_size
+        right, bottom = self.size
+        # Chunks on the layer's right/bottom edge only cover the layer itself.
+        width = min(self.chunk_size, right - left)
+        height = min(self.chunk_size, bottom - top)
+        # Tiles are only turned into drawings when their chunk is first drawn.
+        tiles = [
+            tile
+            for grid in self.grids
+            for tile in grid.tiles(left, top, left + width, top + height)
+        ]
+        if not tiles:
+            self._empty_chunks.add(chunk)
+            return None
+
+        surface = Surface((width, height), SRCALPHA).convert_alpha()
+        top_left = Coordinate(left, top)
+        surface.blits(
+            (tile.drawing.pygame, tile.top_left - top_left) for tile in tiles
+        )
+        drawing_on_screen = Drawing(surface).drawing_on_screen(top_left)
+        _chunks()[key] = drawing_on_screen
+        return drawing_on_screen
+
+
+def _chunk_bytes(drawing_on_screen: DrawingOnScreen) -> int:
+    surface = drawing_on_screen.drawing.surface
+    return surface.get_bytesize() * surface.width * surface.height
+
+
+@cache
+def _chunks() -> LRUCache[tuple[Metadata, Pixel, _Chunk], DrawingOnScreen]:
+    size = config().system.resource.map_chunk_cache_bytes
+    return LRUCache(size, getsizeof=_chunk_bytes)
@@ -1,10 +1,15 @@
-import heapq
-from collections.abc import Iterable
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
 from dataclasses import KW_ONLY, dataclass, field, replace
 from functools import cached_property
+from itertools import chain
+from operator import itemgetter
 from typing import Self
 
+from pygame.mask import Mask
 from pytmx import TiledObject, TiledTileLayer
+from pytmx.pytmx import AnimationFrame
 
 from nextrpg.animation.animation_on_screen import AnimationOnScreen
 from nextrpg.animation.animation_on_screens import AnimationOnScreens
@@ -21,46 +26,89 @@ from nextrpg.core.metadata import METADATA_CACHE_KEY, Metadata
 from nextrpg.core.time import Millisecond
 from nextrpg.core.tmx_loader import TmxLoader, get_geometry, is_rect
 from nextrpg.drawing.drawing import Drawing
+from nextrpg.drawing.drawing_group import DrawingGroup
 from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
 from nextrpg.drawing.drawing_on_screens import (
     DrawingOnScreens,
     drawing_on_screens,
 )
-from nextrpg.drawing.sprite import tick_all
 from nextrpg.drawing.sprite_on_screen import (
     SpriteOnScreen,
 )
 from nextrpg.geometry.area_on_screen import AreaOnScreen
+from nextrpg.geometry.collision_mask import collision_mask
 from nextrpg.geometry.coordinate import Coordinate, YAxis
 from nextrpg.geometry.polygon_area_on_screen import PolygonAreaOnScreen
-from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.rectangle_area_on_screen import (
+    RectangleAreaOnScreen,
+    merge_rectangle_area_on_screens,
+)
 from nextrpg.geometry.size import Size
+from nextrpg.geometry.spatial_grid import SpatialGrid
+from nextrpg.map.chunked_layer import ChunkedLayer, TileGrid
 
 
-@dataclass(frozen=True)
+@dataclass_with_default(frozen=True)
 class ForegroundLayers:
     tiles: tuple[AnimationOnScreens, ...]
+    _: KW_ONLY = private_init_below()
+    _grid: SpatialGrid = default(lambda self: _spatial_grid(self.tiles))
+    _bottoms: tuple[YAxis, ...] = default(
+        lambda self: tuple(_sort_by_bottom(tile) for tile in self.tiles)
+    )
+    _animated: tuple[bool, ...] = default(
+        lambda self: tuple(_has_animation(tile) for tile in self.tiles)
+    )
+    _time: Millisecond = 0
+
+    @property
+    def time(self) -> Millisecond:
+        return self._time
+
+    @cached_property
+    def tile_frames(self) -> _Frames:
+        # Replaced on every tick, so each animation resolves once per frame.
+        return {}
 
     def tick(self, time_delta: Millisecond) -> Self:
-        tiles = tick_all(self.tiles, time_delta)
-        return replace(self, tiles=tiles)
+        return replace(self, _time=self._time + time_delta)
 
     def drawing_on_screens(
-        self, characters: Iterable[CharacterOnScreen]
+        self,
+        characters: Iterable[CharacterOnScreen],
+        viewport: RectangleAreaOnScreen | None = None,
     ) -> DrawingOnScreens:
+        # Tiles are static and kept sorted by bottom, so only the visible ones
+        # are drawn and characters are placed among them by binary search.
+        if viewport:
+            indices = self._grid.query(viewport)
+        else:
+            indices = range(len(self.tiles))
+        bottoms = [self._bottoms[i] for i in indices]
+        tiles = [self._tile_drawing_on_screens(i) for i in indices]
         character_drawing_on_screens = sorted(
-            (character.drawing_on_screens for character in characters),
-            key=_sort_by_bottom,
+            (
+                (_sort_by_bottom(drawing), drawing)
+                for drawing in (c.drawing_on_screens for c in characters)
+            ),
+            key=itemgetter(0),
         )
-        tile_drawing_on_screens = [
-            tile.drawing_on_screens for tile in self.tiles
-        ]
-        all_drawing_on_screens = heapq.merge(
-            tile_drawing_on_screens,
-            character_drawing_on_screens,
-            key=_sort_by_bottom,
-        )
-        return drawing_on_screens(all_drawing_on_screens)
+        res: list[DrawingOnScreens] = []
+        start = 0
+        for bottom, character in character_drawing_on_screens:
+            end = bisect_right(bottoms, bottom, start)
+            res += tiles[start:end]
+            res.append(character)
+            start = end
+        res += tiles[start:]
+        return drawing_on_screens(res)
+
+    def _tile_drawing_on_screens(self, index: int) -> DrawingOnScreens:
+        # Static groups keep their cached drawings across frames.
+        tile = self.tiles[index]
+        if self._animated[index]:
+            tile = _tile_at(tile, self._time, self.tile_frames)
+        return tile.drawing_on_screens
 
 
 @dataclass_with_default(frozen=True)
@@ -74,19 +122,62 @@ class MapLoader(TmxLoader):
     above_characters: AnimationOnScreens = default(
         lambda self: self._draw_layers(self.config.above_character)
     )
+    _animations: tuple[CyclicAnimation, ...] = default(
+        lambda self: tuple(self._tile_animations.values())
+    )
     collisions: tuple[AreaOnScreen, ...] = default(
         lambda self: self._init_collisions
     )
+    _background_grid: SpatialGrid = default(
+        lambda self: _spatial_grid(self.backgrounds.resources)
+    )
+    _above_character_grid: SpatialGrid = default(
+        lambda self: _spatial_grid(self.above_characters.resources)
+    )
+    collision_grid: SpatialGrid = default(
+        lambda self: _spatial_grid(self.collisions)
+    )
+    collision_mask: Mask | None = default(
+        lambda self: self._init_collision_mask
+    )
 
     def tick(self, time_delta: Millisecond) -> Self:
-        backgrounds = self.backgrounds.tick(time_delta)
+        # Tiles are drawn at the map's clock instead of being ticked one by one.
+        # The clock lives on the foregrounds, which are replaced every tick.
         foregrounds = self.foregrounds.tick(time_delta)
-        above_characters = self.above_characters.tick(time_delta)
-        return replace(
-            self,
-            backgrounds=backgrounds,
-            foregrounds=foregrounds,
-            above_characters=above_characters,
+        return replace(self, foregrounds=foregrounds)
+
+    @cached_property
+    def time_until_change(self) -> Millisecond | None:
+        time = self.foregrounds.time
+        return min(
+            (
+                animation.tick(time).time_until_change
+                for animation in self._animations
+            ),
+            default=None,
+        )
+
+    def visible_backgrounds(
+        self, viewport: RectangleAreaOnScreen
+    ) -> DrawingOnScreens:
+        return _visible(
+            self.backgrounds,
+            self._background_grid,
+            viewport,
+            self.foregrounds.time,
+            self.foregrounds.tile_frames,
+        )
+
+    def visible_above_characters(
+        self, viewport: RectangleAreaOnScreen
+    ) -> DrawingOnScreens:
+        return _visible(
+            self.above_characters,
+            self._above_character_grid,
+            viewport,
+            self.foregrounds.time,
+            self.foregrounds.tile_frames,
         )
 
     @cached_property
@@ -98,24 +189,27 @@ class MapLoader(TmxLoader):
     @cached_property
     def _colliders(self) -> tuple[_Collider, ...]:
         return tuple(
-            _Collider(_TileCoordinate(left, top), collider)
+            _Collider(left, top, collider)
             for layer in self._all_tile_layers
-            for top, left, gid in layer
-            for collider in self._collider(gid)
+            for left, top, gid in layer
+            for collider in self._tile_colliders.get(gid, ())
         )
 
-    def _collider(self, gid: _Gid) -> tuple[TiledObject, ...]:
-        return tuple(
-            self._tmx.tile_properties.get(gid, {}).get("colliders", ())
-        )
+    @cached_property
+    def _tile_colliders(self) -> dict[_Gid, tuple[TiledObject, ...]]:
+        return {
+            gid: tuple(colliders)
+            for gid, properties in self._tmx.tile_properties.items()
+            if (colliders := properties.get("colliders"))
+        }
 
     def _polygon(self, collider: _Collider) -> AreaOnScreen:
         return self._from_rect(collider) or self._from_points(collider)
 
     def _from_points(self, collider: _Collider) -> PolygonAreaOnScreen:
         width, height = self._tile_size
-        left_shift = collider.coordinate.left * width
-        top_shift = collider.coordinate.top * height
+        left_shift = collider.left * width
+        top_shift = collider.top * height
         points = tuple(
             Coordinate(left + left_shift, top + top_shift)
             for left, top in collider.object.as_points
@@ -127,75 +221,70 @@ class MapLoader(TmxLoader):
             return None
 
         width, height = self._tile_size
-        left = collider.object.x + collider.coordinate.left * width
-        top = collider.object.y + collider.coordinate.top * height
+        left = collider.object.x + collider.left * width
+        top = collider.object.y + collider.top * height
         map_coord = Coordinate(left, top)
         size = Size(collider.object.width, collider.object.height)
         return RectangleAreaOnScreen(map_coord, size)
 
-    def _tile_layers(self, class_name: str) -> tuple[TiledTileLayer, ...]:
+    def _tile_layers(self, class_name: str) -> tuple[_TileLayer, ...]:
         return tuple(
             layer
             for layer in self._all_tile_layers
-            if getattr(layer, "class", None) == class_name
-            or class_name in layer.name
+            if layer.class_name == class_name or class_name in layer.name
         )
 
     @cached_property
-    def _all_tile_layers(self) -> tuple[TiledTileLayer, ...]:
-        return tuple(self._layer(i) for i in self._tmx.visible_tile_layers)
+    def _all_tile_layers(self) -> tuple[_TileLayer, ...]:
+        return tuple(
+            _tile_layer(self._layer(i)) for i in self._tmx.visible_tile_layers
+        )
 
-    def _tile_class(
-        self, layer: TiledTileLayer, coordinate: _TileCoordinate
-    ) -> str | None:
-        tile_id = _tile_id(layer, coordinate)
-        return self._tmx.tile_properties.get(tile_id, {}).get("type")
+    @cached_property
+    def _tile_classes(self) -> dict[_Gid, str]:
+        return {
+            gid: cls
+            for gid, properties in self._tmx.tile_properties.items()
+            if (cls := properties.get("type"))
+        }
 
     def _connected(
-        self,
-        layer: TiledTileLayer,
-        coordinate: _TileCoordinate,
-        connected_tile_ids: set[_Gid] | None = None,
-    ) -> set[_TileCoordinate]:
-        res = {coordinate}
-        if not (cls := self._tile_class(layer, coordinate)):
-            return res
-
-        coord_tile_id = _tile_id(layer, coordinate)
-        if connected_tile_ids:
-            connected_tile_ids.add(coord_tile_id)
-        else:
-            connected_tile_ids = {coord_tile_id}
-
+        self, layer: _TileLayer, start: int, grouped: bytearray
+    ) -> list[int]:
+        gids = layer.gids
+        if not (cls := self._tile_classes.get(gids[start])):
+            return [start]
+
+        connected: list[int] = []
+        connected_gids: set[_Gid] = set()
         # Only need to search bottom and right, given the foreground traversal
-        # (coordinate_to_resource) is already top-to-bottom and left-to-right.
-        for left_shift, top_shift in ((1, 0), (0, 1)):
-            neighbor = _TileCoordinate(
-                coordinate.left + left_shift, coordinate.top + top_shift
-            )
-            if (
-                self._tile_class(layer, neighbor) == cls
-                and _tile_id(layer, neighbor) not in connected_tile_ids
-            ):
-                res |= self._connected(layer, neighbor, connected_tile_ids)
-        return res
-
-    def _foreground(
-        self, layer: TiledTileLayer
-    ) -> tuple[AnimationOnScreens, ...]:
-        visited: set[_TileCoordinate] = set()
+        # is already top-to-bottom and left-to-right. Right is popped first.
+        stack = [start]
+        while stack:
+            index = stack.pop()
+            if (gid := gids[index]) in connected_gids:
+                continue
+            connected_gids.add(gid)
+            connected.append(index)
+            grouped[index] = True
+            for neighbor in _right_and_bottom(layer, index):
+                if (
+                    not grouped[neighbor]
+                    and self._tile_classes.get(gids[neighbor]) == cls
+                ):
+                    stack.append(neighbor)
+        return connected
+
+    def _foreground(self, layer: _TileLayer) -> tuple[AnimationOnScreens, ...]:
+        grouped = bytearray(len(layer.gids))
         groups: list[AnimationOnScreens] = []
-        for coordinate in (resources := self._coordinate_to_resource(layer)):
-            if coordinate in visited:
+        for index, gid in enumerate(layer.gids):
+            if not gid or grouped[index]:
                 continue
-            connected_coordinates = self._connected(layer, coordinate)
-            visited |= connected_coordinates
-            connected_resources = tuple(
-                resource
-                for coordinate in connected_coordinates
-                if (resource := resources.get(coordinate)) is not None
+            connected = self._connected(layer, index, grouped)
+            group = AnimationOnScreens(
+                tuple(self._tile_at_index(layer, i) for i in connected)
             )
-            group = AnimationOnScreens(connected_resources)
             groups.append(group)
         return tuple(groups)
 
@@ -203,42 +292,67 @@ class MapLoader(TmxLoader):
     def _tile_size(self) -> Size:
         return Size(self._tmx.tilewidth, self._tmx.tileheight)
 
-    def _coordinate_to_resource(
-        self, layer: TiledTileLayer
-    ) -> dict[_TileCoordinate, AnimationOnScreen | DrawingOnScreen]:
-        return {
-            _TileCoordinate(left, top): self._tile(left, top, gid)
-            for left, top, gid in layer
-            if gid
-        }
+    def _tile_at_index(
+        self, layer: _TileLayer, index: int
+    ) -> AnimationOnScreen | DrawingOnScreen:
+        top, left = divmod(index, layer.width)
+        return self._tile(left, top, layer.gids[index])
 
     def _tile(
         self, left: int, top: int, gid: _Gid
     ) -> AnimationOnScreen | DrawingOnScreen:
         width, height = self._tile_size
         coordinate = Coordinate(left * width, top * height)
-        if frame_infos := self._tmx.tile_properties.get(gid, {}).get("frames"):
-            frames = tuple(
-                Drawing(
-                    self._tmx.images[frame_info.gid],
-                    metadata=self._metadata(frame_info.gid),
-                )
-                for frame_info in frame_infos
-            )
-            durations = tuple(frame_info.duration for frame_info in frame_infos)
-            animation = CyclicAnimation(frames, durations)
+        if (animation := self._tile_animations.get(gid)) is not None:
             return animation.animation_on_screen(coordinate)
-        drawing = Drawing(self._tmx.images[gid], metadata=self._metadata(gid))
-        return drawing.drawing_on_screen(coordinate)
+        return self._tile_drawing(gid).drawing_on_screen(coordinate)
+
+    def _tile_drawing(self, gid: _Gid) -> Drawing:
+        if (drawing := self._tile_drawings.get(gid)) is None:
+            image = self._tmx.images[gid]
+            drawing = Drawing(image, metadata=self._metadata(gid))
+            self._tile_drawings[gid] = drawing
+        return drawing
+
+    @cached_property
+    def _tile_drawings(self) -> dict[_Gid, Drawing]:
+        return {}
+
+    @cached_property
+    def _tile_animations(self) -> dict[_Gid, CyclicAnimation]:
+        # Tiles of one gid share an animation, so it advances once per frame.
+        return {
+            gid: self._tile_animation(frame_infos)
+            for gid, properties in self._tmx.tile_properties.items()
+            if (frame_infos := properties.get("frames"))
+        }
+
+    def _tile_animation(
+        self, frame_infos: list[AnimationFrame]
+    ) -> CyclicAnimation:
+        frames = tuple(
+            self._tile_drawing(frame_info.gid) for frame_info in frame_infos
+        )
+        durations = tuple(frame_info.duration for frame_info in frame_infos)
+        return CyclicAnimation(frames, durations)
 
     def _metadata(self, gid: _Gid) -> Metadata:
         return METADATA_CACHE_KEY, ("tmx", self.file), ("gid", gid)
 
-    @property
-    def collision_visuals(self) -> DrawingOnScreens:
-        if (debug := config().debug) and (color := debug.collision_rectangle):
-            return drawing_on_screens(c.fill(color) for c in self.collisions)
-        return DrawingOnScreens()
+    def collision_visuals(
+        self, viewport: RectangleAreaOnScreen | None = None
+    ) -> DrawingOnScreens:
+        if not (debug := config().debug) or not (
+            color := debug.collision_rectangle
+        ):
+            return DrawingOnScreens()
+        if viewport:
+            collisions = (
+                self.collisions[i] for i in self.collision_grid.query(viewport)
+            )
+        else:
+            collisions = self.collisions
+        return drawing_on_screens(c.fill(color) for c in collisions)
 
     @property
     def _init_foregrounds(self) -> ForegroundLayers:
@@ -250,33 +364,46 @@ class MapLoader(TmxLoader):
         return ForegroundLayers(tuple(tiles))
 
     def _draw_layers(self, class_name: str) -> AnimationOnScreens:
-        resources = tuple(
-            resource
-            for layer in self._tile_layers(class_name)
-            for resource in self._coordinate_to_resource(layer).values()
-        )
-        static = drawing_on_screens(
-            resource
-            for resource in resources
-            if isinstance(resource, DrawingOnScreen)
-        )
+        layers = self._tile_layers(class_name)
         dynamic = tuple(
-            resource
-            for resource in resources
-            if not isinstance(resource, DrawingOnScreen)
+            self._tile(left, top, gid)
+            for layer in layers
+            for left, top, gid in layer
+            if gid in self._tile_animations
         )
-        if static:
-            static_merged = static.drawing_on_screen
-            merged = dynamic + (static_merged,)
+        # Static tiles stay as gids until the chunk holding them is drawn.
+        grids = tuple(
+            grid
+            for layer in layers
+            if (grid := self._tile_grid(layer)).drawings
+        )
+        if grids:
+            metadata = (
+                METADATA_CACHE_KEY,
+                ("tmx", self.file),
+                ("layer", class_name),
+            )
+            chunked = ChunkedLayer(grids, metadata, self.config.chunk_size)
+            merged = dynamic + (chunked,)
         else:
             merged = dynamic
         return AnimationOnScreens(merged)
 
+    def _tile_grid(self, layer: _TileLayer) -> TileGrid:
+        drawings = {
+            gid: self._tile_drawing(gid)
+            for gid in set(layer.gids)
+            if gid and gid not in self._tile_animations
+        }
+        return TileGrid(layer.width, self._tile_size, layer.gids, drawings)
+
     @property
     def _init_collisions(self) -> tuple[AreaOnScreen, ...]:
-        from_tiles = tuple(
-            self._polygon(collider) for collider in self._colliders
-        )
+        tiles = tuple(self._polygon(collider) for collider in self._colliders)
+        # Adjacent tile rectangles merge so a wall is a single collision.
+        from_tiles = merge_rectangle_area_on_screens(
+            t for t in tiles if isinstance(t, RectangleAreaOnScreen)
+        ) + tuple(t for t in tiles if not isinstance(t, RectangleAreaOnScreen))
         collision = self.config.collision
         from_objects = tuple(
             poly
@@ -293,24 +420,104 @@ class MapLoader(TmxLoader):
         )
         return from_tiles + from_objects + from_layers
 
+    @property
+    def _init_collision_mask(self) -> Mask | None:
+        if self.config.collision_mask:
+            return collision_mask(self.collisions, self.map_size)
+        return None
+
 
 type _Gid = int
+type _Frames = dict[int, Drawing | DrawingGroup]
 
 
 @dataclass(frozen=True)
-class _TileCoordinate:
+class _Collider:
     left: int
     top: int
+    object: TiledObject
 
 
 @dataclass(frozen=True)
-class _Collider:
-    coordinate: _TileCoordinate
-    object: TiledObject
+class _TileLayer:
+    name: str
+    class_name: str | None
+    width: int
+    gids: array[int]
+
+    def __iter__(self) -> Iterator[tuple[int, int, _Gid]]:
+        for index, gid in enumerate(self.gids):
+            if gid:
+                top, left = divmod(index, self.width)
+                yield left, top, gid
+
+
+def _tile_layer(layer: TiledTileLayer) -> _TileLayer:
+    # Gids are kept in one flat array, drawables are built from them on demand.
+    gids = array("I", chain.from_iterable(layer.data))
+    class_name = getattr(layer, "class", None)
+    return _TileLayer(layer.name, class_name, layer.width, gids)
+
+
+def _right_and_bottom(layer: _TileLayer, index: int) -> Iterator[int]:
+    if (bottom := index + layer.width) < len(layer.gids):
+        yield bottom
+    if (right := index + 1) % layer.width:
+        yield right
+
+
+def _spatial_grid(
+    sizables: Iterable[SpriteOnScreen | AreaOnScreen],
+) -> SpatialGrid:
+    rects = tuple(sizable.rectangle_area_on_screen for sizable in sizables)
+    return SpatialGrid(rects)
+
+
+def _visible(
+    layer: AnimationOnScreens,
+    grid: SpatialGrid,
+    viewport: RectangleAreaOnScreen,
+    time: Millisecond,
+    frames: _Frames,
+) -> DrawingOnScreens:
+    resources = layer.resources
+    return drawing_on_screens(
+        _visible_resource(_tile_at(resources[i], time, frames), viewport)
+        for i in grid.query(viewport)
+    )
+
+
+def _tile_at(
+    tile: SpriteOnScreen, time: Millisecond, frames: _Frames
+) -> SpriteOnScreen:
+    match tile:
+        case AnimationOnScreen(resource=CyclicAnimation() as animation):
+            if (frame := frames.get(id(animation))) is None:
+                frame = animation.tick(time).drawing
+                frames[id(animation)] = frame
+            return frame.drawing_on_screens(tile.coordinate, tile.anchor)
+        case AnimationOnScreens():
+            return AnimationOnScreens(
+                tuple(_tile_at(t, time, frames) for t in tile.resources)
+            )
+    return tile
+
+
+def _has_animation(tile: SpriteOnScreen) -> bool:
+    match tile:
+        case AnimationOnScreen(resource=CyclicAnimation()):
+            return True
+        case AnimationOnScreens():
+            return any(_has_animation(t) for t in tile.resources)
+    return False
 
 
-def _tile_id(layer: TiledTileLayer, coordinate: _TileCoordinate) -> _Gid:
-    return layer.data[coordinate.top][coordinate.left]
+def _visible_resource(
+    resource: SpriteOnScreen, viewport: RectangleAreaOnScreen
+) -> SpriteOnScreen:
+    if isinstance(resource, ChunkedLayer):
+        return resource.visible(viewport)
+    return resource
 
 
 def _sort_by_bottom(animation_on_screen_like: SpriteOnScreen) -> YAxis:
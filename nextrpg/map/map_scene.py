@@ -7,6 +7,9 @@ from typing import Self, override
 from nextrpg.audio.music import play_music
 from nextrpg.character.character_drawing import CharacterDrawing
 from nextrpg.character.character_on_screen import CharacterOnScreen
+from nextrpg.character.moving_character_on_screen import (
+    MovingCharacterOnScreen,
+)
 from nextrpg.character.moving_npc_on_screen import MovingNpcOnScreen
 from nextrpg.character.npc_on_screen import NpcOnScreen
 from nextrpg.character.npc_spec import NpcSpec, to_strict_npc_spec
@@ -26,6 +29,7 @@ from nextrpg.core.dataclass_with_default import (
 from nextrpg.core.logger import Logger
 from nextrpg.core.time import Millisecond
 from nextrpg.core.tmx_loader import get_geometry
+from nextrpg.core.util import Percentage
 from nextrpg.drawing.color import TRANSPARENT, Color
 from nextrpg.drawing.drawing import Drawing
 from nextrpg.drawing.drawing_on_screen import DrawingOnScreen
@@ -44,6 +48,9 @@ from nextrpg.geometry.area_on_screen import AreaOnScreen
 from nextrpg.geometry.coordinate import Coordinate
 from nextrpg.geometry.polyline_on_screen import PolylineOnScreen
 from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.size import Size
+from nextrpg.geometry.spatial_grid import SpatialGrid
+from nextrpg.gui.screen_area import screen_size
 from nextrpg.map.map_loader import MapLoader
 from nextrpg.map.map_move import MapMove
 from nextrpg.map.map_shift import center_player
@@ -66,6 +73,15 @@ class MapScene(EventfulScene):
     player: PlayerOnScreen = default(
         lambda self: self.init_player(self.spec.player)
     )
+    _move_areas: tuple[AreaOnScreen, ...] = default(
+        lambda self: tuple(self._move_area(move) for move in self._moves)
+    )
+    _move_grid: SpatialGrid = default(
+        lambda self: SpatialGrid(
+            tuple(area.rectangle_area_on_screen for area in self._move_areas)
+        )
+    )
+    _offscreen_time: Millisecond = 0
 
     @cached_property
     def stop_player(self) -> Self:
@@ -78,11 +94,12 @@ class MapScene(EventfulScene):
         if not (coordinate := spec.coordinate_override):
             player_object = self.map_loader.get_object(spec.unique_name)
             coordinate = Coordinate(player_object.x, player_object.y)
-        map_collisions = self.map_loader.collisions
         return PlayerOnScreen(
             spec=spec,
             coordinate=coordinate,
-            map_collisions=map_collisions,
+            map_collisions=self.map_loader.collisions,
+            map_collision_grid=self.map_loader.collision_grid,
+            map_collision_mask=self.map_loader.collision_mask,
         )
 
     @override
@@ -90,20 +107,53 @@ class MapScene(EventfulScene):
         self, time_delta: Millisecond, state: GameState
     ) -> tuple[Scene, GameState]:
         play_music(self.spec.music)
-        for move in self._moves:
-            if res := self._move(move, time_delta, state):
-                return res
+        player = self.player.drawing_on_screen.rectangle_area_on_screen
+        # Polygon move areas count touching edges, so include those too.
+        for index in self._move_grid.query(player, touching=True):
+            if player.collide(self._move_areas[index]):
+                move = self._moves[index]
+                moved, state = move(self, self.player, state)
+                return moved.tick(time_delta, state)
         return super().tick(time_delta, state)
 
+    @override
+    def interpolate(self, previous: Scene, alpha: Percentage) -> Self:
+        # Don't slide characters across a map transition.
+        if (
+            not isinstance(previous, MapScene)
+            or previous.map_loader.file != self.map_loader.file
+        ):
+            return self
+        return super().interpolate(previous, alpha)
+
     @override
     def tick_without_event(
         self, time_delta: Millisecond, state: GameState
     ) -> tuple[Self, GameState]:
         ticked, state = super().tick_without_event(time_delta, state)
         map_loader = self.map_loader.tick(time_delta)
-        tick_with_map_loader = replace(ticked, map_loader=map_loader)
+        if self._offscreen_time_delta(time_delta) is None:
+            offscreen_time = self._offscreen_time + time_delta
+        else:
+            offscreen_time = 0
+        tick_with_map_loader = replace(
+            ticked, map_loader=map_loader, _offscreen_time=offscreen_time
+        )
         return tick_with_map_loader, state
 
+    @override
+    @cached_property
+    def time_until_change(self) -> Millisecond | None:
+        # Only a still map waits for its next tile frame to change.
+        if (
+            self._event
+            or self._started_npc
+            or self._background_events
+            or any(_animated(c) for c in chain((self.player,), self.npcs))
+        ):
+            return None
+        return self.map_loader.time_until_change
+
     @override
     @cached_property
     def drawing_on_screens_shift(self) -> Coordinate:
@@ -118,14 +168,20 @@ class MapScene(EventfulScene):
     @override
     def drawing_on_screens_before_shift(self) -> DrawingOnScreens:
         player_tuple: tuple[CharacterOnScreen, ...] = (self.player,)
-        characters = chain(player_tuple, self.npcs)
+        characters = (
+            character
+            for character in chain(player_tuple, self.npcs)
+            if character.rectangle_area_on_screen.collide(self._viewport)
+        )
         foreground_and_characters = (
-            self.map_loader.foregrounds.drawing_on_screens(characters)
+            self.map_loader.foregrounds.drawing_on_screens(
+                characters, self._viewport
+            )
         )
         return (
-            self.map_loader.backgrounds.drawing_on_screens
+            self.map_loader.visible_backgrounds(self._viewport)
             + foreground_and_characters
-            + self.map_loader.above_characters.drawing_on_screens
+            + self.map_loader.visible_above_characters(self._viewport)
             + self._debug_visuals
         )
 
@@ -140,10 +196,59 @@ class MapScene(EventfulScene):
             return menu_scene, state
         return super().event(event, state)
 
+    @override
+    def _tick_npcs(self, time_delta: Millisecond) -> tuple[NpcOnScreen, ...]:
+        offscreen_time_delta = self._offscreen_time_delta(time_delta)
+        return tuple(
+            self._tick_npc(npc, time_delta, offscreen_time_delta)
+            for npc in self.npcs
+        )
+
+    def _tick_npc(
+        self,
+        npc: NpcOnScreen,
+        time_delta: Millisecond,
+        offscreen_time_delta: Millisecond | None,
+    ) -> NpcOnScreen:
+        if self._lod_area is None or npc.rectangle_area_on_screen.collide(
+            self._lod_area
+        ):
+            return npc.tick_with_others(time_delta, self._character_index)
+        # Far off-screen NPCs only catch up once per time step, unanimated.
+        if offscreen_time_delta is None:
+            return npc
+        return npc.tick_with_others(
+            offscreen_time_delta, self._character_index, animate=False
+        )
+
+    def _offscreen_time_delta(
+        self, time_delta: Millisecond
+    ) -> Millisecond | None:
+        offscreen_time = self._offscreen_time + time_delta
+        if offscreen_time < self.map_loader.config.npc_lod_time_step:
+            return None
+        return offscreen_time
+
+    @cached_property
+    def _lod_area(self) -> RectangleAreaOnScreen | None:
+        if (margin := self.map_loader.config.npc_lod_margin) is None:
+            return None
+        left, top = self._viewport.top_left
+        width, height = self._viewport.size
+        return RectangleAreaOnScreen(
+            Coordinate(left - margin, top - margin),
+            Size(width + 2 * margin, height + 2 * margin),
+        )
+
+    @cached_property
+    def _viewport(self) -> RectangleAreaOnScreen:
+        top_left = -self.drawing_on_screens_shift
+        return top_left.as_top_left_of(screen_size()).rectangle_area_on_screen
+
     @cached_property
     def _debug_visuals(self) -> DrawingOnScreens:
         return (
-            self.map_loader.collision_visuals
+            self.map_loader.collision_visuals(self._viewport)
             + self._npc_paths
             + self._move_visuals
         )
@@ -162,35 +267,13 @@ class MapScene(EventfulScene):
             )
         return DrawingOnScreens()
 
-    @cached_property
-    def _move_areas(self) -> tuple[AreaOnScreen, ...]:
-        return tuple(
-            geometry
-            for move in self._moves
-            if isinstance(
-                geometry := get_geometry(
-                    self.map_loader.get_object(move.from_object)
-                ),
-                AreaOnScreen,
-            )
-        )
-
-    def _move(
-        self, move: MapMove, time_delta: Millisecond, state: GameState
-    ) -> tuple[Scene, GameState] | None:
+    def _move_area(self, move: MapMove) -> AreaOnScreen:
         move_object = self.map_loader.get_object(move.from_object)
         move_area = get_geometry(move_object)
         assert isinstance(
             move_area, AreaOnScreen
         ), f"'{move.from_object}' needs to be an area."
-
-        if self.player.drawing_on_screen.rectangle_area_on_screen.collide(
-            move_area
-        ):
-            moved, state = move(self, self.player, state)
-            ticked, state = moved.tick(time_delta, state)
-            return ticked, state
-        return None
+        return move_area
 
     @cached_property
     def _npc_paths(self) -> DrawingOnScreens:
@@ -228,6 +311,12 @@ class MapScene(EventfulScene):
         return self.spec.npc
 
 
+def _animated(character: CharacterOnScreen) -> bool:
+    if isinstance(character, MovingCharacterOnScreen) and character.moving:
+        return True
+    return character.character_drawing.animated_on_idle
+
+
 def _init_standing_npc(spec: NpcSpec, coordinate: Coordinate) -> NpcOnScreen:
     assert isinstance(
         spec.character_drawing, CharacterDrawing
@@ -2,8 +2,10 @@ from functools import cached_property
 from typing import TYPE_CHECKING
 
 from nextrpg.core.time import Millisecond
+from nextrpg.core.util import Percentage
 from nextrpg.drawing.drawing_on_screens import DrawingOnScreens
 from nextrpg.event.base_event import BaseEvent
+from nextrpg.gui.frame import Blit, blits
 
 if TYPE_CHECKING:
     from nextrpg.game.game_state import GameState
@@ -14,11 +16,22 @@ class Scene:
     def drawing_on_screens(self) -> DrawingOnScreens:
         return DrawingOnScreens()
 
+    @cached_property
+    def blits(self) -> tuple[Blit, ...]:
+        return blits(self.drawing_on_screens)
+
+    @cached_property
+    def time_until_change(self) -> Millisecond | None:
+        return None
+
     def tick(
         self, time_delta: Millisecond, state: GameState
     ) -> tuple[Scene, GameState]:
         return self, state
 
+    def interpolate(self, previous: Scene, alpha: Percentage) -> Scene:
+        return self
+
     def event(
         self, event: BaseEvent, state: GameState
     ) -> tuple[Scene, GameState]:
@@ -13,6 +13,7 @@ from nextrpg.core.dataclass_with_default import (
     private_init_below,
 )
 from nextrpg.core.time import Millisecond
+from nextrpg.core.trace import span
 from nextrpg.core.util import background_thread
 from nextrpg.drawing.drawing_on_screens import DrawingOnScreens
 from nextrpg.drawing.sprite_on_screen import (
@@ -71,7 +72,7 @@ class TransitionScene(Scene):
         else:
             if callable(self.to_scene_and_state):
                 to_scene_and_state = background_thread().submit(
-                    self.to_scene_and_state, state
+                    _load, self.to_scene_and_state, state
                 )
             else:
                 to_scene_and_state = self.to_scene_and_state
@@ -141,3 +142,11 @@ class TransitionScene(Scene):
         if callable(self.from_scene):
             return self.from_scene()
         return self.from_scene
+
+
+def _load(
+    to_scene_and_state: Callable[[GameState], ToSceneAndState],
+    state: GameState,
+) -> ToSceneAndState:
+    with span("Load scene", "transition"):
+        return to_scene_and_state(state)
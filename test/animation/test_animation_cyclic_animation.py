@@ -0,0 +1,41 @@
+"""Tests for nextrpg.animation.cyclic_animation module."""
+
+from unittest.mock import Mock
+
+from nextrpg.animation.cyclic_animation import CyclicAnimation
+
+FRAMES = (Mock(), Mock(), Mock())
+
+
+class TestCyclicAnimation:
+    """Test frame selection from elapsed time."""
+
+    def test_frame_changes_at_duration(self):
+        """Test that each frame lasts exactly its duration."""
+        animation = CyclicAnimation(FRAMES, 100)
+
+        assert animation.drawing is FRAMES[0]
+        assert animation.tick(99).drawing is FRAMES[0]
+        assert animation.tick(100).drawing is FRAMES[1]
+        assert animation.tick(50).tick(50).drawing is FRAMES[1]
+
+    def test_long_tick_wraps_around(self):
+        """Test that large time deltas land on the right frame."""
+        animation = CyclicAnimation(FRAMES, (100, 200, 300))
+
+        assert animation.tick(150).drawing is FRAMES[1]
+        assert animation.tick(600 * 1000 + 350).drawing is FRAMES[2]
+
+    def test_time_until_change(self):
+        """Test that the next frame change is reported."""
+        animation = CyclicAnimation(FRAMES, (100, 200, 300))
+
+        assert animation.time_until_change == 100
+        assert animation.tick(150).time_until_change == 150
+
+    def test_reset(self):
+        """Test that reset returns to the first frame."""
+        animation = CyclicAnimation(FRAMES, 100).tick(150)
+
+        assert animation.reset.drawing is FRAMES[0]
+        assert animation.reset.time_until_change == 100
@@ -0,0 +1,53 @@
+"""Tests for nextrpg.character.character_index module."""
+
+from unittest.mock import Mock
+
+from nextrpg.character.character_index import CharacterIndex
+from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.size import Size
+
+
+def _rect(
+    left: int, top: int, width: int, height: int
+) -> RectangleAreaOnScreen:
+    return RectangleAreaOnScreen(Coordinate(left, top), Size(width, height))
+
+
+def _character(rect: RectangleAreaOnScreen) -> Mock:
+    return Mock(
+        collision_rectangle_area_on_screen=rect,
+        start_event_area_on_screen=rect,
+        bottom_center=rect.bottom_center,
+    )
+
+
+class TestCharacterIndex:
+    """Test querying nearby characters from a per-tick index."""
+
+    def test_collide_candidates_are_nearby_others(self):
+        """Test that only nearby characters other than the mover return."""
+        mover = _character(_rect(0, 0, 10, 10))
+        near = _character(_rect(10, 0, 10, 10))
+        far = _character(_rect(1000, 1000, 10, 10))
+        index = CharacterIndex((mover, near, far))
+
+        assert index.collide_candidates(_rect(5, 0, 10, 10), mover) == (near,)
+
+    def test_start_event_candidates_keep_order(self):
+        """Test that candidates keep the order characters were indexed in."""
+        player = _character(_rect(0, 0, 10, 10))
+        first = _character(_rect(5, 5, 10, 10))
+        second = _character(_rect(-5, -5, 10, 10))
+        index = CharacterIndex((player, first, second))
+
+        assert index.start_event_candidates(player) == (first, second)
+
+    def test_collection_of_characters(self):
+        """Test that the index can stand in for the list of others."""
+        character = _character(_rect(0, 0, 10, 10))
+        index = CharacterIndex((character,))
+
+        assert len(index) == 1
+        assert character in index
+        assert list(index) == [character]
@@ -0,0 +1,32 @@
+"""Tests for nextrpg.config.system.window_config module."""
+
+from dataclasses import replace
+
+from nextrpg.config.system.window_config import WindowConfig, WindowScaling
+from nextrpg.geometry.size import Size
+
+
+class TestNeedNewScreen:
+    """Test when a window config change requires a new screen."""
+
+    def test_title_change_keeps_screen(self):
+        """Test that changes not affecting the screen keep it."""
+        window_config = WindowConfig()
+
+        assert not replace(window_config, title="x").need_new_screen(
+            window_config
+        )
+
+    def test_resize_needs_new_screen(self):
+        """Test that resizing rebuilds the screen."""
+        window_config = WindowConfig()
+        resized = replace(window_config, size=Size(640, 360))
+
+        assert resized.need_new_screen(window_config)
+
+    def test_scaling_change_needs_new_screen(self):
+        """Test that switching scaling mode rebuilds the frame buffers."""
+        window_config = WindowConfig(scaling=WindowScaling.SMOOTH)
+        integer = replace(window_config, scaling=WindowScaling.INTEGER)
+
+        assert integer.need_new_screen(window_config)
@@ -0,0 +1,54 @@
+"""Tests for nextrpg.core.profiler module."""
+
+from nextrpg.core import profiler
+from nextrpg.core.profiler import Phase, PhaseStats, phase_stats, profile
+
+
+class TestProfile:
+    """Test recording phase timings."""
+
+    def setup_method(self):
+        profiler._samples(Phase.EVENT).clear()
+
+    def test_profile_records_a_sample(self):
+        """Test that each profiled block adds one sample."""
+        with profile(Phase.EVENT):
+            pass
+
+        assert len(profiler._samples(Phase.EVENT)) == 1
+        assert profiler._samples(Phase.EVENT)[0] >= 0
+
+    def test_profile_records_on_exception(self):
+        """Test that a failing block is still timed."""
+        try:
+            with profile(Phase.EVENT):
+                raise ValueError
+        except ValueError:
+            pass
+
+        assert len(profiler._samples(Phase.EVENT)) == 1
+
+    def test_samples_are_a_ring_buffer(self):
+        """Test that old samples are dropped once the buffer is full."""
+        samples = profiler._samples(Phase.EVENT)
+        samples.extend(range(samples.maxlen + 10))
+
+        assert len(samples) == samples.maxlen
+        assert samples[0] == 10
+
+
+class TestPhaseStats:
+    """Test percentile computation."""
+
+    def setup_method(self):
+        profiler._samples(Phase.FLIP).clear()
+
+    def test_no_samples(self):
+        """Test that a phase without samples has no stats."""
+        assert phase_stats(Phase.FLIP) is None
+
+    def test_percentiles(self):
+        """Test p50, p95 and p99 over 100 samples."""
+        profiler._samples(Phase.FLIP).extend(reversed(range(100)))
+
+        assert phase_stats(Phase.FLIP) == PhaseStats(50, 95, 99)
@@ -0,0 +1,73 @@
+"""Tests for nextrpg.core.trace module."""
+
+import json
+from threading import Thread
+
+from nextrpg.core.trace import (
+    is_tracing,
+    span,
+    start_trace,
+    stop_trace,
+    toggle_trace,
+)
+
+
+def _trace_events(tmp_path) -> list[dict]:
+    text = (tmp_path / "nextrpg_trace.json").read_text()
+    return json.loads(text)["traceEvents"]
+
+
+class TestTrace:
+    """Test recording and writing Chrome trace events."""
+
+    def test_span_without_trace_is_a_no_op(self, tmp_path, monkeypatch):
+        """Test that spans outside a trace record nothing."""
+        monkeypatch.chdir(tmp_path)
+        with span("idle"):
+            pass
+
+        assert not is_tracing()
+        stop_trace()
+        assert not (tmp_path / "nextrpg_trace.json").exists()
+
+    def test_spans_are_written_as_complete_events(self, tmp_path, monkeypatch):
+        """Test that spans become Chrome "X" events with a duration."""
+        monkeypatch.chdir(tmp_path)
+        start_trace()
+        with span("tick", "loop"):
+            pass
+        stop_trace()
+
+        events = [e for e in _trace_events(tmp_path) if e["ph"] == "X"]
+        assert [(e["name"], e["cat"]) for e in events] == [("tick", "loop")]
+        assert events[0]["dur"] >= 0
+        assert not is_tracing()
+
+    def test_worker_threads_are_named(self, tmp_path, monkeypatch):
+        """Test that spans from other threads carry a thread name."""
+        monkeypatch.chdir(tmp_path)
+        start_trace()
+
+        def work() -> None:
+            with span("load"):
+                pass
+
+        thread = Thread(target=work, name="worker")
+        thread.start()
+        thread.join()
+        stop_trace()
+
+        names = [
+            e["args"]["name"] for e in _trace_events(tmp_path) if e["ph"] == "M"
+        ]
+        assert names == ["worker"]
+
+    def test_toggle_trace(self, tmp_path, monkeypatch):
+        """Test that toggling starts and then stops tracing."""
+        monkeypatch.chdir(tmp_path)
+        toggle_trace()
+        assert is_tracing()
+
+        toggle_trace()
+        assert not is_tracing()
+        assert (tmp_path / "nextrpg_trace.json").exists()
@@ -0,0 +1,91 @@
+"""Tests for nextrpg.game.game_loop module."""
+
+from unittest.mock import Mock, call, patch
+
+from pygame import KEYDOWN, KEYUP, NOEVENT
+
+from nextrpg.config.system.game_loop_config import GameLoopConfig
+from nextrpg.game.game_loop import GameLoop, _wait_for_input
+
+
+def _loop(time_until_change: int | None, idle: bool = True) -> GameLoop:
+    scene = Mock(time_until_change=time_until_change)
+    return GameLoop(
+        entry_scene=lambda: scene,
+        state=Mock(),
+        _clock=Mock(),
+        _window=Mock(),
+        _config=GameLoopConfig(idle_frames_per_second=5),
+        _idle=idle,
+    )
+
+
+class TestIdleTimeout:
+    """Test how long an idle loop sleeps before drawing again."""
+
+    def test_idle_frame_interval(self):
+        """Test that an idle loop without a schedule waits one idle frame."""
+        assert _loop(None)._idle_timeout == 200
+
+    def test_capped_by_scene_change(self):
+        """Test that the wait ends at the scene's next scheduled change."""
+        assert _loop(50)._idle_timeout == 50
+        assert _loop(500)._idle_timeout == 200
+
+    def test_capped_by_max_frames_per_second(self):
+        """Test that the wait is never shorter than a full-speed frame."""
+        assert _loop(1)._idle_timeout == 1000 / 60
+
+    def test_busy_loop_does_not_wait(self):
+        """Test that a loop that is not idle does not wait for input."""
+        assert _loop(50, idle=False)._idle_timeout is None
+
+
+class TestStill:
+    """Test deciding whether the loop idles after a frame."""
+
+    def test_unchanged_frame(self):
+        """Test that an unchanged frame idles without a scene schedule."""
+        frame = Mock()
+
+        assert _loop(None)._still(frame, frame)
+
+    def test_changed_frame_with_schedule_stays_idle(self):
+        """Test that a scheduled animation frame does not leave idle."""
+        assert _loop(300)._still(Mock(), Mock())
+
+    def test_changed_frame_without_schedule(self):
+        """Test that an unscheduled change returns to full speed."""
+        assert not _loop(None)._still(Mock(), Mock())
+
+    def test_no_frame(self):
+        """Test that a loop without a frame is not idle."""
+        assert not _loop(300)._still(None, None)
+
+
+class TestWaitForInput:
+    """Test waking an idle loop on input."""
+
+    def test_timeout(self):
+        """Test that nothing is queued back when no input arrives."""
+        with (
+            patch("pygame.event.wait", return_value=Mock(type=NOEVENT)) as wait,
+            patch("pygame.event.post") as post,
+        ):
+            _wait_for_input(200)
+
+        wait.assert_called_once_with(200)
+        post.assert_not_called()
+
+    def test_input_is_queued_back_in_order(self):
+        """Test that the waking input is kept ahead of later input."""
+        pressed = Mock(type=KEYDOWN)
+        released = Mock(type=KEYUP)
+        with (
+            patch("pygame.event.wait", return_value=pressed),
+            patch("pygame.event.get", return_value=[released]),
+            patch("pygame.event.post") as post,
+        ):
+            _wait_for_input(200)
+
+        assert post.call_args_list == [call(pressed), call(released)]
@@ -0,0 +1,36 @@
+"""Tests for nextrpg.geometry.collision_mask module."""
+
+from nextrpg.geometry.collision_mask import collide_mask, collision_mask
+from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.size import Size
+
+
+def _rect(
+    left: int, top: int, width: int, height: int
+) -> RectangleAreaOnScreen:
+    return RectangleAreaOnScreen(Coordinate(left, top), Size(width, height))
+
+
+class TestCollisionMask:
+    """Test rasterized map collisions."""
+
+    def test_overlapping_rectangle_collides(self):
+        """Test that a rectangle over a collision area collides."""
+        mask = collision_mask((_rect(10, 10, 20, 20),), Size(100, 100))
+
+        assert collide_mask(mask, _rect(25, 25, 10, 10))
+        assert not collide_mask(mask, _rect(50, 50, 10, 10))
+
+    def test_touching_edges_do_not_collide(self):
+        """Test that sharing an edge matches rectangle collision."""
+        mask = collision_mask((_rect(0, 0, 10, 10),), Size(100, 100))
+
+        assert not collide_mask(mask, _rect(10, 0, 10, 10))
+
+    def test_rectangle_outside_map(self):
+        """Test that rectangles partly outside the map still test inside."""
+        mask = collision_mask((_rect(0, 0, 10, 10),), Size(100, 100))
+
+        assert collide_mask(mask, _rect(-5, -5, 10, 10))
+        assert not collide_mask(mask, _rect(-20, -20, 10, 10))
@@ -0,0 +1,82 @@
+"""Tests for nextrpg.geometry.polygon_area_on_screen module."""
+
+from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.polygon_area_on_screen import PolygonAreaOnScreen
+from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.size import Size
+
+L_SHAPE = PolygonAreaOnScreen(
+    (
+        Coordinate(0, 0),
+        Coordinate(30, 0),
+        Coordinate(30, 10),
+        Coordinate(10, 10),
+        Coordinate(10, 30),
+        Coordinate(0, 30),
+    )
+)
+
+
+def _rect(
+    left: int, top: int, width: int, height: int
+) -> RectangleAreaOnScreen:
+    return RectangleAreaOnScreen(Coordinate(left, top), Size(width, height))
+
+
+class TestPolygonCollision:
+    """Test separating axis collision between polygons."""
+
+    def test_convex_polygons_collide(self):
+        """Test that overlapping convex polygons collide."""
+        triangle = PolygonAreaOnScreen(
+            (Coordinate(0, 0), Coordinate(20, 0), Coordinate(0, 20))
+        )
+
+        assert triangle.collide(_rect(5, 5, 10, 10))
+        assert not triangle.collide(_rect(15, 15, 10, 10))
+
+    def test_concave_notch_does_not_collide(self):
+        """Test that a rectangle inside a concave notch does not collide."""
+        assert not L_SHAPE.collide(_rect(15, 15, 10, 10))
+        assert _rect(15, 15, 10, 10).collide(L_SHAPE) is False
+
+    def test_concave_arm_collides(self):
+        """Test that a rectangle over an arm of a concave polygon collides."""
+        assert L_SHAPE.collide(_rect(20, 2, 5, 5))
+        assert L_SHAPE.collide(_rect(2, 20, 5, 5))
+
+    def test_convex_polygon_is_its_own_part(self):
+        """Test that convex polygons are not decomposed."""
+        square = _rect(0, 0, 10, 10)._polygon
+
+        assert square._convex_parts == (square,)
+
+    def test_concave_polygon_parts_cover_its_area(self):
+        """Test that convex parts have the same total area."""
+
+        def area(points: tuple[Coordinate, ...]) -> float:
+            pairs = zip(points, points[1:] + points[:1])
+            return abs(sum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in pairs))
+
+        parts = L_SHAPE._convex_parts
+
+        assert len(parts) > 1
+        assert sum(area(p.points) for p in parts) == area(L_SHAPE.points)
+
+
+class TestPolygonContainment:
+    """Test point-in-polygon checks."""
+
+    def test_point_inside_arm(self):
+        """Test that points within the polygon are contained."""
+        assert Coordinate(5, 25) in L_SHAPE
+        assert Coordinate(25, 5) in L_SHAPE
+
+    def test_point_in_notch(self):
+        """Test that points in a concave notch are not contained."""
+        assert Coordinate(20, 20) not in L_SHAPE
+
+    def test_point_outside_bounds(self):
+        """Test that points outside the bounding rectangle are rejected."""
+        assert Coordinate(-5, 5) not in L_SHAPE
+        assert Coordinate(5, 100) not in L_SHAPE
@@ -266,3 +266,38 @@ class TestPolylineIntegration:
         assert scaled_polyline.length == pytest.approx(
             polyline.length * 2, rel=0.01
         )
+
+
+class TestPolylineArcLength:
+    """Test cumulative arc lengths and positions along a polyline."""
+
+    @pytest.fixture
+    def square(self):
+        """Create an open square path."""
+        return PolylineOnScreen(
+            (
+                Coordinate(0, 0),
+                Coordinate(100, 0),
+                Coordinate(100, 100),
+                Coordinate(0, 100),
+            )
+        )
+
+    def test_arc_lengths_include_closing_segment(self, square):
+        """Test that arc lengths accumulate back to the first point."""
+        assert square.arc_lengths == (0, 100, 200, 300, 400)
+        assert square.length == 400
+
+    def test_segment_index(self, square):
+        """Test that distances map to the segment they fall on."""
+        assert square.segment_index(0) == 0
+        assert square.segment_index(150) == 1
+        assert square.segment_index(200) == 2
+        assert square.segment_index(400) == 3
+
+    def test_point_at(self, square):
+        """Test that points are interpolated along their segment."""
+        assert square.point_at(0) == Coordinate(0, 0)
+        assert square.point_at(150) == Coordinate(100, 50)
+        assert square.point_at(300) == Coordinate(0, 100)
+        assert square.point_at(350) == Coordinate(0, 50)
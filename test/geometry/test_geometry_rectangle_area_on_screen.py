@@ -3,7 +3,10 @@
 import pytest
 
 from nextrpg.geometry.coordinate import Coordinate
-from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.rectangle_area_on_screen import (
+    RectangleAreaOnScreen,
+    merge_rectangle_area_on_screens,
+)
 from nextrpg.geometry.size import Height, Size, Width
 
 
@@ -269,3 +272,42 @@ class TestRectangleIntegration:
 
         assert rect.size.width_value == 100
         assert rect.size.height_value == 50
+
+
+class TestMergeRectangleAreaOnScreens:
+    """Test greedy merging of adjacent rectangles."""
+
+    def test_row_of_tiles_merges_into_one(self):
+        """Test that a wall of touching tiles becomes a single rectangle."""
+        tiles = (
+            RectangleAreaOnScreen(Coordinate(i * 16, 0), Size(16, 16))
+            for i in range(100)
+        )
+
+        assert merge_rectangle_area_on_screens(tiles) == (
+            RectangleAreaOnScreen(Coordinate(0, 0), Size(1600, 16)),
+        )
+
+    def test_block_of_tiles_merges_into_one(self):
+        """Test that rows with matching extents merge vertically."""
+        tiles = (
+            RectangleAreaOnScreen(Coordinate(x * 16, y * 16), Size(16, 16))
+            for x in range(4)
+            for y in range(3)
+        )
+
+        assert merge_rectangle_area_on_screens(tiles) == (
+            RectangleAreaOnScreen(Coordinate(0, 0), Size(64, 48)),
+        )
+
+    def test_gaps_and_mismatched_rows_are_kept(self):
+        """Test that rectangles are only merged when the union is exact."""
+        left = RectangleAreaOnScreen(Coordinate(0, 0), Size(16, 16))
+        apart = RectangleAreaOnScreen(Coordinate(32, 0), Size(16, 16))
+        below = RectangleAreaOnScreen(Coordinate(0, 16), Size(8, 16))
+
+        assert merge_rectangle_area_on_screens((apart, below, left)) == (
+            left,
+            below,
+            apart,
+        )
@@ -0,0 +1,62 @@
+"""Tests for nextrpg.geometry.spatial_grid module."""
+
+from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.rectangle_area_on_screen import RectangleAreaOnScreen
+from nextrpg.geometry.size import Size
+from nextrpg.geometry.spatial_grid import SpatialGrid
+
+
+def _rect(
+    left: int, top: int, width: int, height: int
+) -> RectangleAreaOnScreen:
+    return RectangleAreaOnScreen(Coordinate(left, top), Size(width, height))
+
+
+class TestSpatialGridQuery:
+    """Test querying rectangles that overlap an area."""
+
+    def test_query_returns_overlapping_indices(self):
+        """Test that only overlapping rectangles are returned."""
+        grid = SpatialGrid(
+            (_rect(0, 0, 10, 10), _rect(500, 500, 10, 10)), cell_size=64
+        )
+
+        assert grid.query(_rect(5, 5, 10, 10)) == [0]
+        assert grid.query(_rect(495, 495, 10, 10)) == [1]
+
+    def test_query_preserves_insertion_order(self):
+        """Test that results are sorted by index for stable draw order."""
+        rects = tuple(_rect(i * 10, 0, 10, 10) for i in range(10))
+        grid = SpatialGrid(rects[::-1], cell_size=16)
+
+        assert grid.query(_rect(0, 0, 100, 10)) == list(range(10))
+
+    def test_touching_edges_do_not_overlap(self):
+        """Test that rectangles sharing an edge are not returned."""
+        grid = SpatialGrid((_rect(0, 0, 10, 10),))
+
+        assert grid.query(_rect(10, 0, 10, 10)) == []
+
+    def test_touching_edges_when_requested(self):
+        """Test that touching rectangles are returned with touching=True."""
+        grid = SpatialGrid((_rect(0, 0, 10, 10),), cell_size=10)
+
+        assert grid.query(_rect(10, 0, 10, 10), touching=True) == [0]
+        assert grid.query(_rect(11, 0, 10, 10), touching=True) == []
+
+    def test_large_rectangle_spanning_cells_is_reported_once(self):
+        """Test that a rectangle registered in many cells is deduplicated."""
+        grid = SpatialGrid((_rect(0, 0, 1000, 1000),), cell_size=32)
+
+        assert grid.query(_rect(100, 100, 500, 500)) == [0]
+
+    def test_negative_coordinates(self):
+        """Test that rectangles left of or above the origin are found."""
+        grid = SpatialGrid((_rect(-100, -100, 50, 50),), cell_size=32)
+
+        assert grid.query(_rect(-80, -80, 10, 10)) == [0]
+        assert grid.query(_rect(0, 0, 10, 10)) == []
+
+    def test_empty_grid(self):
+        """Test that an empty grid returns no results."""
+        assert SpatialGrid(()).query(_rect(0, 0, 10, 10)) == []
@@ -262,8 +262,8 @@ class TestWalkReset:
 class TestWalkProperties:
     """Test walk properties."""
 
-    def test_walk_initial_point(self):
-        """Test walk initial point property."""
+    def test_walk_starts_at_first_point(self):
+        """Test that a walk starts at the path's first point."""
         path = PolylineOnScreen(
             (
                 Coordinate(50, 50),
@@ -272,7 +272,7 @@ class TestWalkProperties:
         )
         walk = Walk(path=path, move_speed=10, cyclic=False)
 
-        assert walk._initial_point == Coordinate(50, 50)
+        assert walk.coordinate == Coordinate(50, 50)
 
     def test_walk_final_target(self):
         """Test walk final target property."""
@@ -287,19 +287,15 @@ class TestWalkProperties:
 
         assert walk._final_target == Coordinate(100, 100)
 
-    def test_walk_remaining_distance(self):
-        """Test walk remaining distance calculation."""
+    def test_walk_advances_along_path(self):
+        """Test that ticking moves the walk forward along the path."""
         path = PolylineOnScreen((Coordinate(0, 0), Coordinate(100, 0)))
         walk = Walk(path=path, move_speed=10, cyclic=False)
 
-        initial_remaining = walk._remaining_dist
-
-        # Move forward
         walked = walk.tick(3)  # Move 30 pixels at 10px/ms
-        new_remaining = walked._remaining_dist
 
-        # Remaining distance should decrease
-        assert new_remaining < initial_remaining
+        assert walked.coordinate == Coordinate(30, 0)
+        assert not walked.complete
 
 
 class TestWalkSaveLoad:
@@ -405,3 +401,56 @@ class TestWalkEdgeCases:
 
         # Should start at that point already at completion
         assert walk.coordinate == Coordinate(0, 0)
+
+
+class TestWalkArcLength:
+    """Test walking by distance along the path."""
+
+    @pytest.fixture
+    def square_path(self):
+        """Create a square path."""
+        return PolylineOnScreen(
+            (
+                Coordinate(0, 0),
+                Coordinate(100, 0),
+                Coordinate(100, 100),
+                Coordinate(0, 100),
+            )
+        )
+
+    def test_walk_across_segments(self, square_path):
+        """Test that one long tick crosses several segments."""
+        walk = Walk(path=square_path, move_speed=10, cyclic=False)
+
+        walked = walk.tick(25)
+
+        assert walked.coordinate == Coordinate(50, 100)
+        assert walked._target_index == 3
+
+    def test_non_cyclic_walk_skips_closing_segment(self, square_path):
+        """Test that a non-cyclic walk ends at the last point."""
+        walk = Walk(path=square_path, move_speed=10, cyclic=False)
+
+        walked = walk.tick(35)
+
+        assert walked.complete is True
+        assert walked.coordinate == Coordinate(0, 100)
+
+    def test_cyclic_walk_uses_closing_segment(self, square_path):
+        """Test that a cyclic walk returns to the first point."""
+        walk = Walk(path=square_path, move_speed=10, cyclic=True)
+
+        walked = walk.tick(35)
+
+        assert walked.coordinate == Coordinate(0, 50)
+        assert walked._target_index == 0
+
+    def test_load_from_save_on_closing_segment(self, square_path):
+        """Test that saved walks resume at the same distance."""
+        walk = Walk(path=square_path, move_speed=10, cyclic=True)
+        walked = walk.tick(35)
+
+        loaded = walk.update_this_class_from_save(walked.save_data_this_class)
+
+        assert loaded.coordinate == walked.coordinate
+        assert loaded.tick(10).coordinate == Coordinate(50, 0)
@@ -0,0 +1,104 @@
+"""Tests for nextrpg.gui.frame module."""
+
+from unittest.mock import Mock
+
+from pygame import Rect, Surface
+
+from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.gui.frame import Frame, blits
+
+
+class TestFrameDirtyRectangles:
+    """Test dirty rectangle computation between two frames."""
+
+    def test_identical_frames_have_no_dirty_rectangles(self):
+        """Test that an unchanged frame produces nothing to redraw."""
+        surface = Surface((10, 10))
+        blits = ((surface, Coordinate(0, 0)),)
+
+        assert Frame(blits).dirty_rectangles(Frame(blits)) == []
+
+    def test_moved_surface_dirties_old_and_new_area(self):
+        """Test that moving a surface covers both positions."""
+        surface = Surface((10, 10))
+        last = Frame(((surface, Coordinate(0, 0)),))
+        frame = Frame(((surface, Coordinate(5, 0)),))
+
+        assert frame.dirty_rectangles(last) == [Rect(0, 0, 15, 10)]
+
+    def test_disjoint_changes_stay_separate(self):
+        """Test that far apart changes are not merged."""
+        background = Surface((100, 100))
+        first = Surface((10, 10))
+        second = Surface((10, 10))
+        last = Frame(((background, Coordinate(0, 0)),))
+        frame = Frame(
+            (
+                (background, Coordinate(0, 0)),
+                (first, Coordinate(0, 0)),
+                (second, Coordinate(50, 50)),
+            )
+        )
+
+        rects = frame.dirty_rectangles(last)
+
+        assert sorted(rects) == [Rect(0, 0, 10, 10), Rect(50, 50, 10, 10)]
+
+    def test_same_surface_is_compared_by_identity(self):
+        """Test that an equal but different surface is treated as changed."""
+        last = Frame(((Surface((10, 10)), Coordinate(0, 0)),))
+        frame = Frame(((Surface((10, 10)), Coordinate(0, 0)),))
+
+        assert frame.dirty_rectangles(last) == [Rect(0, 0, 10, 10)]
+
+    def test_swapped_draw_order_dirties_overlap(self):
+        """Test that reordering overlapping blits redraws both."""
+        first = (Surface((10, 10)), Coordinate(0, 0))
+        second = (Surface((10, 10)), Coordinate(5, 0))
+        last = Frame((first, second))
+        frame = Frame((second, first))
+
+        assert frame.dirty_rectangles(last) == [Rect(0, 0, 15, 10)]
+
+    def test_shifted_slots_are_dirty(self):
+        """Test that blits moving to another slot are redrawn."""
+        background = (Surface((100, 100)), Coordinate(0, 0))
+        tile = (Surface((10, 10)), Coordinate(50, 50))
+        character = (Surface((10, 10)), Coordinate(0, 0))
+        last = Frame((background, tile))
+        frame = Frame((background, character, tile))
+
+        rects = frame.dirty_rectangles(last)
+
+        assert sorted(rects) == [Rect(0, 0, 10, 10), Rect(50, 50, 10, 10)]
+
+    def test_many_changes_collapse_into_one_rectangle(self):
+        """Test that many changes are redrawn as a single union."""
+        blits = tuple(
+            (Surface((1, 1)), Coordinate(i * 10, 0)) for i in range(20)
+        )
+
+        rects = Frame(blits).dirty_rectangles(Frame(()))
+
+        assert rects == [Rect(0, 0, 191, 1)]
+
+
+class TestBlits:
+    """Test turning drawings into blit commands."""
+
+    def test_without_camera_reuses_drawing_blits(self):
+        """Test that unshifted drawings emit their own blit pairs."""
+        pair = (Surface((10, 10)), Coordinate(1, 2))
+        drawing_on_screen = Mock(pygame=pair)
+
+        assert blits([drawing_on_screen]) == (pair,)
+        assert blits([drawing_on_screen])[0] is pair
+
+    def test_camera_shifts_every_blit(self):
+        """Test that the camera offset is applied to each position."""
+        surface = Surface((10, 10))
+        drawing_on_screen = Mock(pygame=(surface, Coordinate(1, 2)))
+
+        res = blits([drawing_on_screen], Coordinate(10, -5))
+
+        assert res == ((surface, Coordinate(11, -3)),)
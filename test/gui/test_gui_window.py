@@ -0,0 +1,70 @@
+"""Tests for nextrpg.gui.window module."""
+
+from dataclasses import replace
+from unittest.mock import patch
+
+from pygame import Color, Surface
+
+from nextrpg.config.system.window_config import WindowConfig, WindowScaling
+from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.size import Size
+from nextrpg.gui.frame import Frame
+from nextrpg.gui.window import Window
+
+RED = Color(255, 0, 0)
+BLUE = Color(0, 0, 255)
+BLACK = Color(0, 0, 0)
+
+
+def _window(size: Size) -> Window:
+    initial = WindowConfig(size=Size(100, 100), scaling=WindowScaling.INTEGER)
+    current = replace(initial, size=size)
+    with patch("nextrpg.gui.window.set_caption"):
+        return Window(
+            initial_config=initial,
+            current_config=current,
+            _screen=Surface(size),
+            _buffers=None,
+        )
+
+
+def _filled(width: int, height: int, color: Color) -> Surface:
+    surface = Surface((width, height))
+    surface.fill(color)
+    return surface
+
+
+class TestWindowGameArea:
+    """Test placing the unscaled game area inside the window."""
+
+    def test_letterbox_uses_subsurface(self):
+        """Test that a game area fitting the window is a subsurface."""
+        window = _window(Size(200, 100))
+
+        assert window._game_area.get_abs_offset() == (50, 0)
+
+    def test_window_smaller_than_game(self):
+        """Test that a game larger than the window is centered and cropped."""
+        window = _window(Size(50, 50))
+        frame = Frame(
+            (
+                (_filled(100, 100, RED), Coordinate(0, 0)),
+                (_filled(10, 10, BLUE), Coordinate(45, 45)),
+            )
+        )
+
+        assert window._game_area is None
+        window._draw_cropped(frame)
+
+        assert window._screen.get_at((0, 0)) == RED
+        assert window._screen.get_at((20, 20)) == BLUE
+
+    def test_window_shorter_than_game_keeps_side_bars(self):
+        """Test that drawings outside the game area stay off the bars."""
+        window = _window(Size(200, 50))
+        frame = Frame(((_filled(20, 20, RED), Coordinate(-10, 30)),))
+
+        window._draw_cropped(frame)
+
+        assert window._screen.get_at((45, 10)) == BLACK
+        assert window._screen.get_at((55, 10)) == RED
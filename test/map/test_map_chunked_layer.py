@@ -0,0 +1,48 @@
+"""Tests for nextrpg.map.chunked_layer module."""
+
+from array import array
+from unittest.mock import Mock
+
+from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.size import Size
+from nextrpg.map.chunked_layer import TileGrid
+
+TILE_SIZE = Size(10, 10)
+
+
+def _drawing(size: Size = TILE_SIZE) -> Mock:
+    drawing = Mock(size=size)
+    drawing.drawing_on_screen.side_effect = lambda coordinate: coordinate
+    return drawing
+
+
+class TestTileGrid:
+    """Test building tile drawings from a gid grid on demand."""
+
+    def test_tiles_in_area(self):
+        """Test that only non-empty tiles overlapping the area are built."""
+        gids = array("I", [1, 0, 1, 1, 1, 0, 0, 0, 1])
+        grid = TileGrid(3, TILE_SIZE, gids, {1: _drawing()})
+
+        tiles = grid.tiles(0, 0, 20, 20)
+
+        assert tiles == [
+            Coordinate(0, 0),
+            Coordinate(0, 10),
+            Coordinate(10, 10),
+        ]
+
+    def test_unknown_gids_are_skipped(self):
+        """Test that gids without a drawing, such as animations, are skipped."""
+        gids = array("I", [1, 2])
+        grid = TileGrid(2, TILE_SIZE, gids, {2: _drawing()})
+
+        assert grid.tiles(0, 0, 20, 10) == [Coordinate(10, 0)]
+
+    def test_oversized_tiles_reach_into_next_area(self):
+        """Test that tiles larger than a cell are found from a later area."""
+        gids = array("I", [1, 0])
+        grid = TileGrid(2, TILE_SIZE, gids, {1: _drawing(Size(20, 10))})
+
+        assert grid.tiles(10, 0, 20, 10) == [Coordinate(0, 0)]
+        assert grid.size == Size(30, 10)
@@ -0,0 +1,53 @@
+"""Tests for nextrpg.map.map_loader module."""
+
+from array import array
+from unittest.mock import Mock
+
+from nextrpg.animation.cyclic_animation import CyclicAnimation
+from nextrpg.geometry.coordinate import Coordinate
+from nextrpg.geometry.size import Size
+from nextrpg.map.map_loader import MapLoader, _Collider, _TileLayer
+
+
+class TestTileColliders:
+    """Test placing tile colliders at their tile on the map."""
+
+    def test_layer_yields_column_then_row(self):
+        """Test that tile layer cells are yielded as column, row and gid."""
+        layer = _TileLayer("layer", None, 3, array("I", [0, 5, 0, 0, 0, 0]))
+
+        assert tuple(layer) == ((1, 0, 5),)
+
+    def test_collider_is_not_transposed(self):
+        """Test that a collider off the diagonal lands at its column and row."""
+        layer = _TileLayer("layer", None, 3, array("I", [0, 5, 0, 0, 0, 0]))
+        rect = Mock(x=2, y=3, width=4, height=5)
+        loader = Mock(_all_tile_layers=(layer,), _tile_colliders={5: (rect,)})
+
+        colliders = MapLoader._colliders.func(loader)
+        area = MapLoader._from_rect(Mock(_tile_size=Size(10, 20)), colliders[0])
+
+        assert colliders == (_Collider(1, 0, rect),)
+        assert area.top_left == Coordinate(12, 3)
+        assert area.size == Size(4, 5)
+
+
+class TestTimeUntilChange:
+    """Test scheduling the next tile animation frame change."""
+
+    def test_earliest_tile_change(self):
+        """Test that the soonest change across tile animations is reported."""
+        frames = (Mock(), Mock(), Mock())
+        animations = (
+            CyclicAnimation(frames, (100, 200, 300)),
+            CyclicAnimation(frames, 1000),
+        )
+        loader = Mock(foregrounds=Mock(time=150), _animations=animations)
+
+        assert MapLoader.time_until_change.func(loader) == 150
+
+    def test_no_tile_animations(self):
+        """Test that a map without tile animations makes no promise."""
+        loader = Mock(foregrounds=Mock(time=150), _animations=())
+
+        assert MapLoader.time_until_change.func(loader) is None